@@ -2,15 +2,24 @@
 # modules, config 없이 모든 기능 통합
 
 import streamlit as st
+import requests
 import os
 import json
+import copy
 import sqlite3
-import base64
+import threading
+import uuid
+import hashlib
 from datetime import datetime, date
 from io import BytesIO
-from typing import Dict, Any, Optional, List, Tuple
+from pathlib import Path
+from typing import Dict, Any, Optional, List, Tuple, Iterator, Mapping
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from contextlib import contextmanager
-from zipfile import ZipFile
+from bisect import bisect_right
+from zipfile import ZipFile, ZipInfo, ZIP_DEFLATED, ZIP_STORED
+from xml.sax.saxutils import escape
 from dotenv import load_dotenv
 
 # 환경 변수 로드
@@ -41,16 +50,36 @@ except:
 try:
     from reportlab.lib.pagesizes import A4
     from reportlab.lib.units import mm
-    from reportlab.pdfgen import canvas
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak
+    from reportlab.platypus import Image as RLImage
     from reportlab.pdfbase import pdfmetrics
     from reportlab.pdfbase.cidfonts import UnicodeCIDFont
 except:
     st.error("ReportLab 라이브러리가 필요합니다. requirements.txt에 reportlab>=4.0.0 추가하세요.")
     st.stop()
 
+# orjson import (선택 - 없으면 표준 json 사용)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # ==================== 설정 (Settings) ====================
 
 DB_PATH = "data/policies.db"
+MEDIA_DIR = "data/media"
+MEDIA_EXTENSIONS = {"image": ".png"}
+
+# 연결마다 적용할 SQLite 설정 (journal_mode=WAL은 DB 파일에 유지됨)
+SQLITE_PRAGMAS = [
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA busy_timeout=5000",
+]
 
 TARGET_AUDIENCES = {
     "시민": {
@@ -91,6 +120,9 @@ VIDEO_PLATFORMS = {
 }
 
 IMAGE_SIZES = ["1024x1024", "1024x1792", "1792x1024"]
+# 미리보기 생성은 가장 빠른 조합으로 고정
+PREVIEW_IMAGE_SIZE = "1024x1024"
+PREVIEW_IMAGE_QUALITY = "standard"
 VIDEO_DURATIONS = ["10초", "20초", "30초", "60초"]
 
 CONTENT_PACKAGES = {
@@ -99,6 +131,9 @@ CONTENT_PACKAGES = {
     "C 풀 패키지": ["이미지 4장", "영상 2개", "홍보 문구 5종", "정책 문서", "PPT", "성과 지표"]
 }
 
+# 자동완성 표시 개수
+AUTOCOMPLETE_LIMIT = 10
+
 DEFAULT_IMAGE_STYLE = """
 PHOTO-REALISTIC Korean documentary style. Shot on Canon EOS R5, 35mm f/1.8, natural daylight.
 
@@ -119,20 +154,50 @@ MUST look like: Real photo taken in Korea TODAY with professional camera.
 
 # ==================== 데이터베이스 (Database) ====================
 
-@contextmanager
-def get_db():
+@st.cache_resource
+def _get_connection() -> sqlite3.Connection:
+    """세션 간 공유하는 SQLite 연결 (프로세스당 1회 생성)"""
     # data 폴더가 없으면 생성
     os.makedirs("data", exist_ok=True)
     conn = sqlite3.connect(DB_PATH, check_same_thread=False)
     conn.row_factory = sqlite3.Row
-    try:
-        yield conn
-    finally:
-        conn.close()
+    for pragma in SQLITE_PRAGMAS:
+        conn.execute(pragma)
+    return conn
 
+@st.cache_resource
+def _get_db_lock() -> threading.RLock:
+    """공유 연결의 트랜잭션이 스레드 간에 섞이지 않도록 직렬화"""
+    return threading.RLock()
+
+@contextmanager
+def get_db():
+    conn = _get_connection()
+    with _get_db_lock():
+        try:
+            yield conn
+        except Exception:
+            conn.rollback()
+            raise
+
+def _json_text(data: Any) -> str:
+    """DB 저장용 JSON 텍스트 (orjson 우선, 기존 행과 같은 TEXT 형식으로 저장)"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(data, ensure_ascii=False)
+
+def _json_loads(raw: Any) -> Any:
+    """DB/API JSON 파싱 (orjson 우선)"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+@st.cache_resource
 def init_database():
+    """스키마 생성 (프로세스당 1회, 하나의 스크립트/트랜잭션으로 실행)"""
     with get_db() as conn:
-        conn.execute("""
+        conn.executescript("""
+            BEGIN;
             CREATE TABLE IF NOT EXISTS policies (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 title TEXT NOT NULL,
@@ -142,10 +207,8 @@ def init_database():
                 status TEXT DEFAULT 'draft',
                 created_at TEXT NOT NULL,
                 updated_at TEXT NOT NULL
-            )
-        """)
-        
-        conn.execute("""
+            );
+            
             CREATE TABLE IF NOT EXISTS policy_contents (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 policy_id INTEGER NOT NULL,
@@ -154,10 +217,8 @@ def init_database():
                 metadata TEXT,
                 created_at TEXT NOT NULL,
                 FOREIGN KEY (policy_id) REFERENCES policies(id)
-            )
-        """)
-        
-        conn.execute("""
+            );
+            
             CREATE TABLE IF NOT EXISTS policy_performance (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 policy_id INTEGER NOT NULL,
@@ -167,10 +228,8 @@ def init_database():
                 metrics_data TEXT,
                 updated_at TEXT NOT NULL,
                 FOREIGN KEY (policy_id) REFERENCES policies(id)
-            )
-        """)
-        
-        conn.execute("""
+            );
+            
             CREATE TABLE IF NOT EXISTS generated_media (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 policy_id INTEGER NOT NULL,
@@ -181,10 +240,13 @@ def init_database():
                 generation_params TEXT,
                 created_at TEXT NOT NULL,
                 FOREIGN KEY (policy_id) REFERENCES policies(id)
-            )
+            );
+            
+            CREATE INDEX IF NOT EXISTS idx_policies_created ON policies(created_at DESC);
+            CREATE INDEX IF NOT EXISTS idx_contents_policy ON policy_contents(policy_id, created_at DESC);
+            CREATE INDEX IF NOT EXISTS idx_media_policy_type ON generated_media(policy_id, media_type, created_at DESC);
+            COMMIT;
         """)
-        
-        conn.commit()
 
 def create_policy(title: str, category: str, target_audience: str, description: str = "") -> int:
     now = datetime.now().isoformat()
@@ -194,7 +256,8 @@ def create_policy(title: str, category: str, target_audience: str, description:
             VALUES (?, ?, ?, ?, 'draft', ?, ?)
         """, (title, category, target_audience, description, now, now))
         conn.commit()
-        return cursor.lastrowid
+    _clear_policy_list_cache()
+    return cursor.lastrowid
 
 def update_policy_status(policy_id: int, status: str):
     now = datetime.now().isoformat()
@@ -203,38 +266,59 @@ def update_policy_status(policy_id: int, status: str):
             UPDATE policies SET status = ?, updated_at = ? WHERE id = ?
         """, (status, now, policy_id))
         conn.commit()
+    _clear_policy_list_cache()
+    get_policy.clear()
 
 def save_policy_content(policy_id: int, content_type: str, content_data: Dict[str, Any], metadata: Optional[Dict] = None):
+    save_policy_contents_bulk(policy_id, [(content_type, content_data, metadata)])
+
+def save_policy_contents_bulk(policy_id: int, items: List[Tuple[str, Dict[str, Any], Optional[Dict]]]):
+    """여러 콘텐츠 섹션을 하나의 트랜잭션으로 저장 (content_type, content_data, metadata)"""
     now = datetime.now().isoformat()
-    with get_db() as conn:
-        conn.execute("""
-            INSERT INTO policy_contents (policy_id, content_type, content_data, metadata, created_at)
-            VALUES (?, ?, ?, ?, ?)
-        """, (
+    rows = [
+        (
             policy_id,
             content_type,
-            json.dumps(content_data, ensure_ascii=False),
-            json.dumps(metadata or {}, ensure_ascii=False),
+            _json_text(content_data),
+            _json_text(metadata or {}),
             now
-        ))
+        )
+        for content_type, content_data, metadata in items
+    ]
+    with get_db() as conn:
+        conn.executemany("""
+            INSERT INTO policy_contents (policy_id, content_type, content_data, metadata, created_at)
+            VALUES (?, ?, ?, ?, ?)
+        """, rows)
         conn.commit()
 
 def save_generated_media(policy_id: int, media_type: str, media_data: bytes, prompt: str, params: Dict[str, Any]):
+    """미디어 바이트는 data/media/{policy_id}/ 에 파일로 저장하고 DB에는 경로만 기록"""
     now = datetime.now().isoformat()
-    with get_db() as conn:
-        conn.execute("""
-            INSERT INTO generated_media (policy_id, media_type, media_data, prompt, generation_params, created_at)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """, (
-            policy_id,
-            media_type,
-            media_data,
-            prompt,
-            json.dumps(params, ensure_ascii=False),
-            now
-        ))
-        conn.commit()
-
+    extension = MEDIA_EXTENSIONS.get(media_type, ".bin")
+    media_path = Path(MEDIA_DIR) / str(policy_id) / f"{uuid.uuid4().hex}{extension}"
+    media_path.parent.mkdir(parents=True, exist_ok=True)
+    media_path.write_bytes(media_data)
+    params_json = _json_text(params)
+    try:
+        with get_db() as conn:
+            conn.execute("""
+                INSERT INTO generated_media (policy_id, media_type, media_url, prompt, generation_params, created_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, (
+                policy_id,
+                media_type,
+                media_path.as_posix(),
+                prompt,
+                params_json,
+                now
+            ))
+            conn.commit()
+    except Exception:
+        media_path.unlink(missing_ok=True)
+        raise
+
+@st.cache_data(ttl=300, show_spinner=False)
 def get_policy(policy_id: int) -> Optional[Dict[str, Any]]:
     with get_db() as conn:
         row = conn.execute("SELECT * FROM policies WHERE id = ?", (policy_id,)).fetchone()
@@ -242,27 +326,47 @@ def get_policy(policy_id: int) -> Optional[Dict[str, Any]]:
             return dict(row)
         return None
 
-def get_all_policies(limit: int = 50) -> List[Dict[str, Any]]:
+def iter_all_policies(limit: int = 50) -> Iterator[Dict[str, Any]]:
+    # 잠금은 행을 가져오는 동안만 유지 (yield 중에 공유 잠금을 잡고 있지 않도록)
     with get_db() as conn:
         rows = conn.execute("""
             SELECT * FROM policies ORDER BY created_at DESC LIMIT ?
         """, (limit,)).fetchall()
-        return [dict(row) for row in rows]
+    for row in rows:
+        yield dict(row)
+
+@st.cache_data(ttl=30, show_spinner=False)
+def get_all_policies(limit: int = 50) -> List[Dict[str, Any]]:
+    return list(iter_all_policies(limit))
 
-def get_policy_contents(policy_id: int) -> List[Dict[str, Any]]:
+def iter_policy_contents(policy_id: int, content_type: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    """최신순으로 한 행씩 JSON 디코딩 (중간에 멈추면 나머지 행은 디코딩하지 않음, 디코딩은 DB 잠금 밖에서)"""
     with get_db() as conn:
-        rows = conn.execute("""
-            SELECT * FROM policy_contents WHERE policy_id = ? ORDER BY created_at DESC
-        """, (policy_id,)).fetchall()
-        results = []
-        for row in rows:
-            data = dict(row)
-            data['content_data'] = json.loads(data['content_data'])
-            data['metadata'] = json.loads(data['metadata']) if data['metadata'] else {}
-            results.append(data)
-        return results
-
-def get_generated_media(policy_id: int, media_type: Optional[str] = None) -> List[Dict[str, Any]]:
+        if content_type:
+            rows = conn.execute("""
+                SELECT * FROM policy_contents WHERE policy_id = ? AND content_type = ? ORDER BY created_at DESC
+            """, (policy_id, content_type)).fetchall()
+        else:
+            rows = conn.execute("""
+                SELECT * FROM policy_contents WHERE policy_id = ? ORDER BY created_at DESC
+            """, (policy_id,)).fetchall()
+    
+    for row in rows:
+        data = dict(row)
+        data['content_data'] = _json_loads(data['content_data'])
+        data['metadata'] = _json_loads(data['metadata']) if data['metadata'] else {}
+        yield data
+
+def _read_media_file(media_url: Optional[str]) -> Optional[bytes]:
+    if not media_url:
+        return None
+    media_path = Path(media_url)
+    if not media_path.is_file():
+        return None
+    return media_path.read_bytes()
+
+def iter_generated_media(policy_id: int, media_type: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    """최신순으로 한 행씩 반환 (파일은 해당 행을 꺼낼 때 읽음, 파일 읽기는 DB 잠금 밖에서)"""
     with get_db() as conn:
         if media_type:
             rows = conn.execute("""
@@ -272,42 +376,42 @@ def get_generated_media(policy_id: int, media_type: Optional[str] = None) -> Lis
             rows = conn.execute("""
                 SELECT * FROM generated_media WHERE policy_id = ? ORDER BY created_at DESC
             """, (policy_id,)).fetchall()
-        
-        results = []
-        for row in rows:
-            data = dict(row)
-            data['generation_params'] = json.loads(data['generation_params']) if data['generation_params'] else {}
-            results.append(data)
-        return results
+    
+    for row in rows:
+        data = dict(row)
+        data['generation_params'] = _json_loads(data['generation_params']) if data['generation_params'] else {}
+        # 파일로 저장된 미디어는 경로에서 읽어옴 (이전 BLOB 행은 그대로 사용)
+        if data['media_data'] is None:
+            data['media_data'] = _read_media_file(data['media_url'])
+        yield data
 
+@st.cache_data(ttl=30, show_spinner=False)
 def get_policies_by_date(date_str: str) -> List[Dict[str, Any]]:
     with get_db() as conn:
         rows = conn.execute("""
             SELECT * FROM policies 
-            WHERE date(created_at) = date(?)
+            WHERE created_at >= date(?1) AND created_at < date(?1, '+1 day')
             ORDER BY created_at DESC
         """, (date_str,)).fetchall()
         return [dict(row) for row in rows]
 
+@st.cache_data(ttl=30, show_spinner=False)
 def get_policies_by_date_range(start_date: str, end_date: str) -> List[Dict[str, Any]]:
     with get_db() as conn:
         rows = conn.execute("""
             SELECT * FROM policies 
-            WHERE date(created_at) BETWEEN date(?) AND date(?)
+            WHERE created_at >= date(?) AND created_at < date(?, '+1 day')
             ORDER BY created_at DESC
         """, (start_date, end_date)).fetchall()
         return [dict(row) for row in rows]
 
-# ==================== AI 엔진 (AI Engine) ====================
+def _clear_policy_list_cache():
+    """정책 목록 캐시 무효화 (정책 생성/상태 변경 시)"""
+    get_all_policies.clear()
+    get_policies_by_date.clear()
+    get_policies_by_date_range.clear()
 
-def parse_json_response(text: str) -> Optional[Dict]:
-    text = text.strip()
-    if text.startswith("```"):
-        text = text.replace("```json", "").replace("```", "").strip()
-    try:
-        return json.loads(text)
-    except:
-        return None
+# ==================== AI 엔진 (AI Engine) ====================
 
 def generate_policy_analysis(
     title: str,
@@ -336,6 +440,10 @@ def generate_policy_analysis(
 - 한국 현실에 맞는 실행 가능한 내용
 - 과장 금지, 측정 가능한 지표 사용
 - 대상에 맞는 톤과 메시지
+- final_image_prompts는 image_brief_1, image_brief_2 순서로, DALL·E에 그대로 입력할 영문 프롬프트 (아래 이미지 스타일 반영, 이미지 안 텍스트 금지)
+
+[이미지 스타일]
+{DEFAULT_IMAGE_STYLE.strip()}
 
 [JSON 스키마]
 {{
@@ -421,6 +529,11 @@ def generate_policy_analysis(
     }}
   }},
   
+  "final_image_prompts": [
+    "image_brief_1 기반 완성 영문 이미지 프롬프트",
+    "image_brief_2 기반 완성 영문 이미지 프롬프트"
+  ],
+  
   "marketing_materials": {{
     "slogan": "슬로건 (20-30자)",
     "tagline": "태그라인 (40-60자)",
@@ -488,50 +601,41 @@ def generate_policy_analysis(
                 {"role": "user", "content": prompt}
             ],
             temperature=0.7,
-            max_tokens=4000
+            max_tokens=6000,
+            response_format={"type": "json_object"}
         )
         
         raw_text = response.choices[0].message.content
-        parsed_data = parse_json_response(raw_text)
-        
-        if parsed_data:
-            return parsed_data, raw_text
-        
-        # JSON 파싱 실패시 재시도
-        retry_prompt = f"""
-이전 응답이 올바른 JSON 형식이 아닙니다.
-아래 내용을 완벽한 JSON으로 다시 출력해주세요.
-
-{raw_text}
-"""
-        
-        retry_response = client.chat.completions.create(
-            model=model,
-            messages=[
-                {"role": "system", "content": "JSON 형식으로만 응답합니다."},
-                {"role": "user", "content": retry_prompt}
-            ],
-            temperature=0.3,
-            max_tokens=4000
-        )
-        
-        retry_text = retry_response.choices[0].message.content
-        retry_parsed = parse_json_response(retry_text)
-        
-        return retry_parsed, retry_text
+        return _json_loads(raw_text), raw_text
         
     except Exception as e:
         return None, f"Error: {str(e)}"
 
-def generate_image_prompt(brief: Dict[str, Any], style_override: str = "") -> str:
-    concept = brief.get("concept", "")
-    scene = brief.get("scene_description", "")
-    style = brief.get("visual_style", "")
-    message = brief.get("key_message", "")
-    
-    base_style = style_override if style_override else DEFAULT_IMAGE_STYLE
-    
-    prompt = f"""
+@st.cache_data(ttl=3600, show_spinner=False)
+def _cached_analysis(
+    title: str,
+    category: str,
+    target_audience: str,
+    description: str,
+    keywords: str = "",
+    constraints: str = "",
+    model: str = "gpt-4o"
+) -> Tuple[Dict, str]:
+    """동일한 입력의 AI 분석 결과 재사용 (실패 결과는 예외로 넘겨 캐시하지 않음)"""
+    analysis, raw = generate_policy_analysis(
+        title=title,
+        category=category,
+        target_audience=target_audience,
+        description=description,
+        keywords=keywords,
+        constraints=constraints,
+        model=model
+    )
+    if not analysis:
+        raise ValueError(raw)
+    return analysis, raw
+
+_IMG_PROMPT_BASE_TMPL = """
 {concept}
 
 Scene description: {scene}
@@ -546,24 +650,49 @@ Important: Create realistic Korean people with natural, undistorted facial featu
 No text or writing should appear anywhere in the image.
 Focus on authentic Korean urban/suburban environment and genuine human expressions.
 """
-    
-    return prompt.strip()
 
-def generate_video_prompts_3styles(brief: Dict[str, Any]) -> Dict[str, str]:
-    """10초 영상 3가지 스타일 프롬프트 생성"""
+# 기본 스타일은 모듈 로드 시 한 번만 템플릿에 삽입
+_IMG_PROMPT_TMPL = _IMG_PROMPT_BASE_TMPL.replace(
+    "{base_style}",
+    DEFAULT_IMAGE_STYLE.replace("{", "{{").replace("}", "}}")
+)
+
+def generate_image_prompt(brief: Dict[str, Any], style_override: str = "") -> str:
+    fields = {
+        "concept": brief.get("concept", ""),
+        "scene": brief.get("scene_description", ""),
+        "style": brief.get("visual_style", ""),
+        "message": brief.get("key_message", ""),
+    }
     
-    narrative = brief.get("narrative_arc", "")
-    cta = brief.get("call_to_action", "")
+    if style_override:
+        prompt = _IMG_PROMPT_BASE_TMPL.format(base_style=style_override, **fields)
+    else:
+        prompt = _IMG_PROMPT_TMPL.format(**fields)
     
-    base_context = f"""
+    return prompt.strip()
+
+def resolve_image_prompt(analysis: Dict[str, Any], brief_key: str) -> str:
+    """AI 분석에 포함된 완성 프롬프트 우선 사용, 없으면 브리프로 조합"""
+    final_prompts = analysis.get("final_image_prompts")
+    idx = int(brief_key.rsplit("_", 1)[-1]) - 1
+    if isinstance(final_prompts, list) and 0 <= idx < len(final_prompts):
+        final_prompt = final_prompts[idx]
+        if isinstance(final_prompt, str) and final_prompt.strip():
+            return final_prompt
+    return generate_image_prompt(analysis["content_briefs"][brief_key])
+
+_VIDEO_BASE_CONTEXT = """
 Duration: 10 seconds
 Location: Modern South Korea
 Language: Korean subtitles only
 No English text visible
 """
-    
+
+# 10초 영상 3가지 스타일 템플릿 ({narrative}, {cta}만 호출 시 채움)
+_VIDEO_STYLE_TMPLS = {
     # 스타일 1: 다큐멘터리
-    style1 = f"""
+    "documentary": """
 [스타일 1: 다큐멘터리 리얼리즘]
 
 {base_context}
@@ -592,10 +721,9 @@ Pacing: Steady, observational
 Final Message: {cta}
 
 Technical: 24fps, cinematic aspect ratio, professional documentary style
-"""
-    
+""".replace("{base_context}", _VIDEO_BASE_CONTEXT),
     # 스타일 2: 시네마틱
-    style2 = f"""
+    "cinematic": """
 [스타일 2: 시네마틱 드라마]
 
 {base_context}
@@ -625,10 +753,9 @@ Pacing: Dynamic with emotional beats
 Final Message: {cta}
 
 Technical: 24fps, anamorphic feel, cinematic color grade
-"""
-    
+""".replace("{base_context}", _VIDEO_BASE_CONTEXT),
     # 스타일 3: 모던 다이내믹
-    style3 = f"""
+    "modern_dynamic": """
 [스타일 3: 모던 다이내믹]
 
 {base_context}
@@ -660,324 +787,375 @@ Pacing: Fast, rhythmic, attention-grabbing
 Final Message: {cta}
 
 Technical: 30fps or 60fps slow-motion elements, high contrast, vibrant colors
-"""
+""".replace("{base_context}", _VIDEO_BASE_CONTEXT)
+}
+
+def generate_video_prompts_3styles(brief: Dict[str, Any]) -> Dict[str, str]:
+    """10초 영상 3가지 스타일 프롬프트 생성"""
+    
+    narrative = brief.get("narrative_arc", "")
+    cta = brief.get("call_to_action", "")
     
     return {
-        "documentary": style1,
-        "cinematic": style2,
-        "modern_dynamic": style3
+        style: template.format(narrative=narrative, cta=cta)
+        for style, template in _VIDEO_STYLE_TMPLS.items()
     }
 
 # ==================== 이미지 생성 (Image Generator) ====================
 
-def generate_policy_image(
-    brief: dict,
-    size: str = "1024x1024",
-    quality: str = "standard"
-) -> Optional[Tuple[Image.Image, bytes]]:
-    """정책 이미지 생성 (brief 기반)"""
+@st.cache_resource
+def _http_session() -> requests.Session:
+    """이미지 다운로드용 공유 세션 (연결 재사용, 동시 다운로드 수만큼 풀 확보)"""
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=4)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+def _download_image(session: requests.Session, url: str) -> bytes:
+    """생성된 이미지 URL을 청크 단위로 내려받음 (base64 디코딩 없이 원본 PNG 바이트)"""
+    buffer = BytesIO()
+    with session.get(url, stream=True, timeout=60) as response:
+        response.raise_for_status()
+        for chunk in response.iter_content(chunk_size=64 * 1024):
+            buffer.write(chunk)
+    return buffer.getvalue()
+
+def _one_image(session: requests.Session, prompt: str, size: str, quality: str) -> Optional[bytes]:
+    """이미지 1장 생성 (작업 스레드에서 실행되므로 st 호출 없이 예외를 그대로 전달)"""
+    response = client.images.generate(
+        model="dall-e-3",
+        prompt=prompt,
+        size=size,
+        quality=quality,
+        n=1,
+        response_format="url"
+    )
     
-    prompt = generate_image_prompt(brief)
+    if response.data and len(response.data) > 0:
+        return _download_image(session, response.data[0].url)
     
-    try:
-        response = client.images.generate(
-            model="dall-e-3",
-            prompt=prompt,
-            size=size,
-            quality=quality,
-            n=1,
-            response_format="b64_json"
-        )
-        
-        if response.data and len(response.data) > 0:
-            b64_data = response.data[0].b64_json
-            image_bytes = base64.b64decode(b64_data)
-            image = Image.open(BytesIO(image_bytes))
-            return (image, image_bytes)
-        
-        return None
-        
-    except Exception as e:
-        st.error(f"이미지 생성 실패: {str(e)}")
-        return None
+    return None
 
-def batch_generate_images(prompts: List[str], size: str = "1024x1024", quality: str = "standard") -> List[Tuple[Image.Image, bytes]]:
-    """여러 이미지 순차 생성"""
-    results = []
-    for prompt in prompts:
-        try:
-            response = client.images.generate(
-                model="dall-e-3",
-                prompt=prompt,
-                size=size,
-                quality=quality,
-                n=1,
-                response_format="b64_json"
-            )
-            
-            if response.data and len(response.data) > 0:
-                b64_data = response.data[0].b64_json
-                image_bytes = base64.b64decode(b64_data)
-                image = Image.open(BytesIO(image_bytes))
-                results.append((image, image_bytes))
-        except Exception as e:
-            st.error(f"이미지 생성 실패: {str(e)}")
-            continue
-    
-    return results
+def make_thumbnail(img_bytes: bytes, max_side: int = 512) -> bytes:
+    """화면 표시용 축소 이미지 (WEBP) - 원본 PNG는 다운로드에만 사용"""
+    img = Image.open(BytesIO(img_bytes))
+    img.thumbnail((max_side, max_side), Image.LANCZOS)
+    out = BytesIO()
+    img.save(out, format="WEBP", quality=80)
+    return out.getvalue()
+
+def batch_generate_images(
+    prompts: List[str],
+    size: str = "1024x1024",
+    quality: str = "standard"
+) -> Iterator[Tuple[int, bytes]]:
+    """여러 이미지 동시 생성 (완료되는 순서대로 (프롬프트 인덱스, PNG 바이트) 반환, PIL 디코딩 없음)"""
+    if not prompts:
+        return
+    
+    # st.cache_resource는 스크립트 스레드에서만 호출 (작업 스레드에는 ScriptRunContext가 없음)
+    session = _http_session()
+    
+    # 동시 요청은 최대 4개로 제한 (OpenAI 요청 한도 고려)
+    with ThreadPoolExecutor(max_workers=min(len(prompts), 4)) as executor:
+        futures = {executor.submit(_one_image, session, prompt, size, quality): idx for idx, prompt in enumerate(prompts)}
+        for future in as_completed(futures):
+            try:
+                image_bytes = future.result()
+            except Exception as e:
+                st.error(f"이미지 생성 실패: {str(e)}")
+                continue
+            if image_bytes:
+                yield (futures[future], image_bytes)
 
 # ==================== PDF/ZIP 내보내기 (Export Manager) ====================
 
+@st.cache_resource
+def _register_pdf_font() -> str:
+    """한글 CID 폰트 등록 (프로세스당 1회, 실패 시 Helvetica)"""
+    try:
+        pdfmetrics.registerFont(UnicodeCIDFont('HYSMyeongJo-Medium'))
+        return 'HYSMyeongJo-Medium'
+    except:
+        return 'Helvetica'
+
+def _pdf_jpeg(img_bytes: bytes) -> Optional[bytes]:
+    """PDF 삽입용 JPEG 변환 (작업 스레드에서 실행, 디코딩 실패 시 None)"""
+    try:
+        out = BytesIO()
+        Image.open(BytesIO(img_bytes)).convert("RGB").save(out, format="JPEG", quality=85, optimize=True)
+        return out.getvalue()
+    except Exception:
+        return None
+
 def create_pdf_report(policy: Dict[str, Any], analysis: Dict[str, Any], images: List[bytes] = None, video_prompts: List[str] = None) -> bytes:
     """한글 정책 보고서 PDF 생성 - AI 분석 9개 항목 전체 포함"""
     
     buffer = BytesIO()
-    c = canvas.Canvas(buffer, pagesize=A4)
-    width, height = A4
+    doc = SimpleDocTemplate(
+        buffer,
+        pagesize=A4,
+        leftMargin=50,
+        rightMargin=50,
+        topMargin=50,
+        bottomMargin=50,
+        title=f"정책 보고서 - {policy.get('title', '')}"
+    )
+    story = []
+    
+    font_name = _register_pdf_font()
+    
+    base_style = getSampleStyleSheet()["Normal"]
+    text_styles = {}
+    
+    def get_style(size, indent=50, space_after=4, keep_with_next=0):
+        key = (size, indent, space_after, keep_with_next)
+        if key not in text_styles:
+            text_styles[key] = ParagraphStyle(
+                f"report_{len(text_styles)}",
+                parent=base_style,
+                fontName=font_name,
+                fontSize=size,
+                leading=size + 4,
+                leftIndent=indent - 50,
+                spaceAfter=space_after,
+                keepWithNext=keep_with_next,
+                wordWrap='CJK'
+            )
+        return text_styles[key]
     
-    # 한글 폰트
-    try:
-        pdfmetrics.registerFont(UnicodeCIDFont('HYSMyeongJo-Medium'))
-        font_name = 'HYSMyeongJo-Medium'
-    except:
-        font_name = 'Helvetica'
-    
-    def new_page():
-        c.showPage()
-        return height - 50
-    
-    def add_heading(y, text, size=14):
-        if y < 100:
-            y = new_page()
-        c.setFont(font_name, size)
-        c.drawString(50, y, text[:90])
-        return y - (size + 15)
-    
-    def add_text(y, text, size=10, indent=60):
-        if y < 80:
-            y = new_page()
-        c.setFont(font_name, size)
-        max_len = 85 if indent == 60 else 90
-        lines = [text[i:i+max_len] for i in range(0, min(len(text), 400), max_len)]
-        for line in lines[:10]:
-            if y < 60:
-                y = new_page()
-                c.setFont(font_name, size)
-            c.drawString(indent, y, line)
-            y -= (size + 4)
-        return y - 5
-    
-    y = height - 50
+    def to_markup(text):
+        return escape(str(text)).replace("\n", "<br/>")
+    
+    def add_heading(text, size=14):
+        story.append(Paragraph(to_markup(text), get_style(size, space_after=10, keep_with_next=1)))
+    
+    def add_text(text, size=10, indent=60):
+        story.append(Paragraph(to_markup(text), get_style(size, indent)))
     
     # 표지
-    c.setFont(font_name, 24)
-    c.drawString(50, y, "정책 보고서")
-    y -= 50
-    c.setFont(font_name, 14)
-    c.drawString(50, y, f"제목: {policy.get('title', '')[:50]}")
-    y -= 25
-    c.setFont(font_name, 11)
-    c.drawString(50, y, f"카테고리: {policy.get('category', '')[:60]}")
-    y -= 20
-    c.drawString(50, y, f"대상: {policy.get('target_audience', '')}")
-    y -= 20
-    c.drawString(50, y, f"생성일: {policy.get('created_at', '')}")
+    story.append(Paragraph(to_markup("정책 보고서"), get_style(24, space_after=26)))
+    story.append(Paragraph(to_markup(f"제목: {policy.get('title', '')}"), get_style(14, space_after=10)))
+    story.append(Paragraph(to_markup(f"카테고리: {policy.get('category', '')}"), get_style(11, space_after=8)))
+    story.append(Paragraph(to_markup(f"대상: {policy.get('target_audience', '')}"), get_style(11, space_after=8)))
+    story.append(Paragraph(to_markup(f"생성일: {policy.get('created_at', '')}"), get_style(11, space_after=8)))
     
     if not analysis:
-        c.save()
-        buffer.seek(0)
-        return buffer.read()
+        doc.build(story)
+        return buffer.getvalue()
     
-    y = new_page()
+    story.append(PageBreak())
     
     # ===== 1. 정책 기획 =====
-    y = add_heading(y, "1. 정책 기획", 16)
+    add_heading("1. 정책 기획", 16)
     if "policy_planning" in analysis:
         planning = analysis["policy_planning"]
         
         if planning.get("objective"):
-            y = add_text(y, f"[목표] {planning['objective']}", 10, 60)
+            add_text(f"[목표] {planning['objective']}", 10, 60)
         
         if planning.get("target_analysis"):
-            y = add_text(y, f"[대상 분석] {planning['target_analysis']}", 10, 60)
+            add_text(f"[대상 분석] {planning['target_analysis']}", 10, 60)
         
         if planning.get("key_strategies"):
-            y = add_text(y, "[핵심 전략]", 11, 60)
+            add_text("[핵심 전략]", 11, 60)
             for idx, s in enumerate(planning["key_strategies"][:8], 1):
-                y = add_text(y, f"{idx}. {s}", 10, 70)
+                add_text(f"{idx}. {s}", 10, 70)
         
         if planning.get("expected_outcomes"):
-            y = add_text(y, "[기대 효과]", 11, 60)
+            add_text("[기대 효과]", 11, 60)
             for o in planning["expected_outcomes"][:5]:
-                y = add_text(y, f"• {o}", 10, 70)
+                add_text(f"• {o}", 10, 70)
     
-    y -= 15
+    story.append(Spacer(1, 15))
     
     # ===== 2. 실행 계획 =====
-    if y < 150:
-        y = new_page()
-    y = add_heading(y, "2. 실행 계획", 16)
+    add_heading("2. 실행 계획", 16)
     if "execution_plan" in analysis:
         execution = analysis["execution_plan"]
         
         if execution.get("action_items"):
-            y = add_text(y, "[실행 항목]", 11, 60)
+            add_text("[실행 항목]", 11, 60)
             for idx, item in enumerate(execution["action_items"][:8], 1):
-                y = add_text(y, f"{idx}. {item.get('action', '')}", 10, 70)
+                add_text(f"{idx}. {item.get('action', '')}", 10, 70)
         
         if execution.get("resources_needed"):
             res = execution["resources_needed"]
-            y = add_text(y, "[필요 자원]", 11, 60)
+            add_text("[필요 자원]", 11, 60)
             if res.get("budget_range"):
-                y = add_text(y, f"예산: {res['budget_range']}", 10, 70)
+                add_text(f"예산: {res['budget_range']}", 10, 70)
             if res.get("personnel"):
-                y = add_text(y, f"인력: {res['personnel']}", 10, 70)
+                add_text(f"인력: {res['personnel']}", 10, 70)
     
-    y -= 15
+    story.append(Spacer(1, 15))
     
     # ===== 3. 커뮤니케이션 전략 =====
-    if y < 150:
-        y = new_page()
-    y = add_heading(y, "3. 커뮤니케이션 전략", 16)
+    add_heading("3. 커뮤니케이션 전략", 16)
     if "communication_strategy" in analysis:
         comm = analysis["communication_strategy"]
         
         if comm.get("key_messages"):
-            y = add_text(y, "[핵심 메시지]", 11, 60)
+            add_text("[핵심 메시지]", 11, 60)
             for idx, msg in enumerate(comm["key_messages"][:8], 1):
-                y = add_text(y, f"{idx}. {msg}", 10, 70)
+                add_text(f"{idx}. {msg}", 10, 70)
         
         if comm.get("channels"):
-            y = add_text(y, "[채널 전략]", 11, 60)
+            add_text("[채널 전략]", 11, 60)
             for ch in comm["channels"][:5]:
-                y = add_text(y, f"• {ch.get('channel', '')}: {ch.get('content_type', '')}", 10, 70)
+                add_text(f"• {ch.get('channel', '')}: {ch.get('content_type', '')}", 10, 70)
     
-    y -= 15
+    story.append(Spacer(1, 15))
     
     # ===== 4. 콘텐츠 제작 브리프 =====
-    if y < 150:
-        y = new_page()
-    y = add_heading(y, "4. 콘텐츠 제작 브리프", 16)
+    add_heading("4. 콘텐츠 제작 브리프", 16)
     if "content_briefs" in analysis:
         briefs = analysis["content_briefs"]
         
         if "image_brief_1" in briefs:
             b1 = briefs["image_brief_1"]
-            y = add_text(y, "[이미지 브리프 1]", 11, 60)
-            y = add_text(y, f"컨셉: {b1.get('concept', '')}", 10, 70)
-            y = add_text(y, f"장면: {b1.get('scene_description', '')}", 10, 70)
+            add_text("[이미지 브리프 1]", 11, 60)
+            add_text(f"컨셉: {b1.get('concept', '')}", 10, 70)
+            add_text(f"장면: {b1.get('scene_description', '')}", 10, 70)
         
         if "image_brief_2" in briefs:
             b2 = briefs["image_brief_2"]
-            y = add_text(y, "[이미지 브리프 2]", 11, 60)
-            y = add_text(y, f"컨셉: {b2.get('concept', '')}", 10, 70)
-            y = add_text(y, f"장면: {b2.get('scene_description', '')}", 10, 70)
+            add_text("[이미지 브리프 2]", 11, 60)
+            add_text(f"컨셉: {b2.get('concept', '')}", 10, 70)
+            add_text(f"장면: {b2.get('scene_description', '')}", 10, 70)
         
         if "video_brief" in briefs:
             vb = briefs["video_brief"]
-            y = add_text(y, "[영상 브리프]", 11, 60)
-            y = add_text(y, f"스토리: {vb.get('narrative_arc', '')}", 10, 70)
+            add_text("[영상 브리프]", 11, 60)
+            add_text(f"스토리: {vb.get('narrative_arc', '')}", 10, 70)
     
-    y -= 15
+    story.append(Spacer(1, 15))
     
     # ===== 5. 마케팅 자료 =====
-    if y < 150:
-        y = new_page()
-    y = add_heading(y, "5. 마케팅 자료", 16)
+    add_heading("5. 마케팅 자료", 16)
     if "marketing_materials" in analysis:
         mk = analysis["marketing_materials"]
         
         if mk.get("slogan"):
-            y = add_text(y, f"[슬로건] {mk['slogan']}", 11, 60)
+            add_text(f"[슬로건] {mk['slogan']}", 11, 60)
         
         if mk.get("tagline"):
-            y = add_text(y, f"[태그라인] {mk['tagline']}", 10, 60)
+            add_text(f"[태그라인] {mk['tagline']}", 10, 60)
         
         if mk.get("elevator_pitch"):
-            y = add_text(y, f"[엘리베이터 피치] {mk['elevator_pitch']}", 10, 60)
+            add_text(f"[엘리베이터 피치] {mk['elevator_pitch']}", 10, 60)
         
         if mk.get("social_media_posts"):
-            y = add_text(y, "[소셜미디어 콘텐츠]", 11, 60)
+            add_text("[소셜미디어 콘텐츠]", 11, 60)
             for idx, post in enumerate(mk["social_media_posts"][:5], 1):
-                y = add_text(y, f"{idx}. {post.get('platform', '')}: {post.get('content', '')}", 10, 70)
+                add_text(f"{idx}. {post.get('platform', '')}: {post.get('content', '')}", 10, 70)
     
-    y -= 15
+    story.append(Spacer(1, 15))
     
     # ===== 6. 성과 지표 (KPI) =====
-    if y < 150:
-        y = new_page()
-    y = add_heading(y, "6. 성과 지표 (KPI)", 16)
+    add_heading("6. 성과 지표 (KPI)", 16)
     if "performance_metrics" in analysis:
         metrics = analysis["performance_metrics"]
         
         if metrics.get("kpi_framework"):
-            y = add_text(y, "[KPI 프레임워크]", 11, 60)
+            add_text("[KPI 프레임워크]", 11, 60)
             for idx, kpi in enumerate(metrics["kpi_framework"][:8], 1):
-                y = add_text(y, f"{idx}. {kpi.get('metric', '')}", 10, 70)
+                add_text(f"{idx}. {kpi.get('metric', '')}", 10, 70)
                 if kpi.get("target_range"):
-                    y = add_text(y, f"   목표: {kpi['target_range']}", 9, 75)
+                    add_text(f"   목표: {kpi['target_range']}", 9, 75)
         
         if metrics.get("success_criteria"):
-            y = add_text(y, "[성공 기준]", 11, 60)
+            add_text("[성공 기준]", 11, 60)
             for sc in metrics["success_criteria"][:5]:
-                y = add_text(y, f"• {sc}", 10, 70)
+                add_text(f"• {sc}", 10, 70)
     
-    y -= 15
+    story.append(Spacer(1, 15))
     
     # ===== 7. 이해관계자 관리 =====
-    if y < 150:
-        y = new_page()
-    y = add_heading(y, "7. 이해관계자 관리", 16)
+    add_heading("7. 이해관계자 관리", 16)
     if "stakeholder_management" in analysis:
         sh = analysis["stakeholder_management"]
         
         if sh.get("stakeholders"):
-            y = add_text(y, "[이해관계자 분석]", 11, 60)
+            add_text("[이해관계자 분석]", 11, 60)
             for idx, s in enumerate(sh["stakeholders"][:6], 1):
-                y = add_text(y, f"{idx}. {s.get('group', '')}: {s.get('interests', '')}", 10, 70)
+                add_text(f"{idx}. {s.get('group', '')}: {s.get('interests', '')}", 10, 70)
         
         if sh.get("objection_handling"):
-            y = add_text(y, "[반대 의견 대응]", 11, 60)
+            add_text("[반대 의견 대응]", 11, 60)
             for obj in sh["objection_handling"][:4]:
-                y = add_text(y, f"• 반대: {obj.get('objection', '')}", 10, 70)
-                y = add_text(y, f"  대응: {obj.get('response', '')}", 9, 75)
+                add_text(f"• 반대: {obj.get('objection', '')}", 10, 70)
+                add_text(f"  대응: {obj.get('response', '')}", 9, 75)
     
-    y -= 15
+    story.append(Spacer(1, 15))
     
     # ===== 8. 이미지 프롬프트 =====
     if images:
-        if y < 150:
-            y = new_page()
-        y = add_heading(y, "8. 생성된 이미지", 16)
+        add_heading("8. 생성된 이미지", 16)
+        
+        # PNG 디코딩·JPEG 인코딩은 GIL을 놓으므로 이미지별로 동시에 변환
+        shown = images[:4]
+        with ThreadPoolExecutor(max_workers=len(shown)) as executor:
+            jpegs = list(executor.map(_pdf_jpeg, shown))
         
-        for idx, img_bytes in enumerate(images[:4], 1):
-            if y < 250:
-                y = new_page()
+        for idx, jpeg_bytes in enumerate(jpegs, 1):
+            if not jpeg_bytes:
+                continue
             try:
-                img = ImageReader(BytesIO(img_bytes))
-                c.drawImage(img, 50, y - 200, width=450, height=200, preserveAspectRatio=True)
-                y -= 220
-                c.setFont(font_name, 10)
-                c.drawString(50, y, f"이미지 {idx}")
-                y -= 30
+                img = RLImage(BytesIO(jpeg_bytes), width=450, height=200, kind='bound', hAlign='LEFT')
             except:
-                pass
+                continue
+            story.append(img)
+            add_text(f"이미지 {idx}", 10, 50)
+            story.append(Spacer(1, 20))
     
     # ===== 9. 영상 프롬프트 =====
     if video_prompts:
-        y = new_page()
-        y = add_heading(y, "9. 영상 프롬프트", 16)
+        story.append(PageBreak())
+        add_heading("9. 영상 프롬프트", 16)
         
         for idx, prompt in enumerate(video_prompts[:9], 1):
-            if y < 150:
-                y = new_page()
-            y = add_text(y, f"[영상 {idx}]", 11, 60)
-            y = add_text(y, prompt[:600], 9, 70)
-            y -= 15
+            add_text(f"[영상 {idx}]", 11, 60)
+            add_text(prompt, 9, 70)
+            story.append(Spacer(1, 15))
     
-    c.save()
-    buffer.seek(0)
-    return buffer.read()
+    doc.build(story)
+    return buffer.getvalue()
+
+def _json_bytes(data: Any) -> bytes:
+    """들여쓰기 JSON을 UTF-8 바이트로 직렬화 (orjson 우선)"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+_README_TMPL = """
+정세담 정책 프로그램 - 결과물 패키지
+
+정책 제목: {title}
+생성일: {created_at}
+
+포함 내용:
+- 정책_보고서_전체.pdf: AI 분석 7개 섹션 + 이미지 + 영상 프롬프트 전체 (PDF)
+- policy_info.json: 정책 기본 정보
+- analysis_full.json: AI 분석 전체 결과 (JSON)
+- images/: 생성된 이미지
+- video_prompts/: 영상 제작 프롬프트
+
+사용 방법:
+1. 정책_보고서_전체.pdf를 열어 전체 내용 확인 (권장)
+2. analysis_full.json을 열어 JSON 형태로 확인
+3. images 폴더의 이미지 활용
+4. video_prompts의 프롬프트를 Sora, Runway, Pika 등에 입력
+"""
+
+def _write_entry(zipf: ZipFile, name: str, data: bytes, date_time: Tuple[int, ...], compress_type: int = ZIP_DEFLATED) -> None:
+    """바이트 데이터를 ZIP 항목으로 스트림 기록 (이미 압축된 PNG·PDF는 ZIP_STORED로 재압축 없이)"""
+    zinfo = ZipInfo(name, date_time=date_time)
+    zinfo.compress_type = compress_type
+    zinfo.external_attr = 0o600 << 16
+    zinfo.file_size = len(data)
+    with zipf.open(zinfo, 'w') as entry:
+        entry.write(data)
 
 def create_zip_export(
     policy: Dict[str, Any],
@@ -990,51 +1168,263 @@ def create_zip_export(
     
     buffer = BytesIO()
     
-    with ZipFile(buffer, 'w') as zipf:
+    # 모든 항목을 바이트로 한 번에 스트림 기록
+    # 텍스트/JSON은 deflate(zlib 기본 레벨 6), PNG·PDF는 무압축 저장 (타임스탬프는 내보내기당 1회 계산)
+    date_time = datetime.now().timetuple()[:6]
+    with ZipFile(buffer, 'w', ZIP_DEFLATED, compresslevel=6) as zipf:
         # PDF 보고서 (최우선)
         if pdf_bytes:
-            zipf.writestr("정책_보고서_전체.pdf", pdf_bytes)
+            _write_entry(zipf, "정책_보고서_전체.pdf", pdf_bytes, date_time, ZIP_STORED)
         
         # 정책 정보
-        zipf.writestr("policy_info.json", json.dumps(policy, ensure_ascii=False, indent=2))
+        _write_entry(zipf, "policy_info.json", _json_bytes(policy), date_time)
         
         # AI 분석 결과
-        zipf.writestr("analysis_full.json", json.dumps(analysis, ensure_ascii=False, indent=2))
+        _write_entry(zipf, "analysis_full.json", _json_bytes(analysis), date_time)
         
         # 이미지
-        if images:
-            for idx, img_bytes in enumerate(images, 1):
-                zipf.writestr(f"images/image_{idx}.png", img_bytes)
+        for idx, img_bytes in enumerate(images or (), 1):
+            _write_entry(zipf, f"images/image_{idx}.png", img_bytes, date_time, ZIP_STORED)
         
         # 영상 프롬프트
-        if video_prompts:
-            for idx, prompt in enumerate(video_prompts, 1):
-                zipf.writestr(f"video_prompts/prompt_{idx}.txt", prompt)
+        for idx, prompt in enumerate(video_prompts or (), 1):
+            _write_entry(zipf, f"video_prompts/prompt_{idx}.txt", prompt.encode("utf-8"), date_time)
         
         # README
-        readme = f"""
-정세담 정책 프로그램 - 결과물 패키지
+        readme = _README_TMPL.format(title=policy['title'], created_at=policy['created_at'])
+        _write_entry(zipf, "README.txt", readme.encode("utf-8"), date_time)
+    
+    return buffer.getvalue()
 
-정책 제목: {policy['title']}
-생성일: {policy['created_at']}
+# 내보내기 파일에 쓰는 영상 스타일 이름 (프롬프트 세트의 키 순서대로)
+_VIDEO_STYLE_LABELS = {
+    "documentary": "다큐멘터리",
+    "cinematic": "시네마틱",
+    "modern_dynamic": "모던 다이내믹"
+}
 
-포함 내용:
-- 정책_보고서_전체.pdf: AI 분석 7개 섹션 + 이미지 + 영상 프롬프트 전체 (PDF)
-- policy_info.json: 정책 기본 정보
-- analysis_full.json: AI 분석 전체 결과 (JSON)
-- images/: 생성된 이미지
-- video_prompts/: 영상 제작 프롬프트
+def build_video_texts(prompt_sets: List[Dict[str, str]]) -> List[str]:
+    """영상 프롬프트 세트를 내보내기용 텍스트 목록으로 변환 ("[세트 n - 스타일]" 머리말 포함)"""
+    return [
+        f"[세트 {idx} - {label}]\n{prompt_set.get(style, '')}"
+        for idx, prompt_set in enumerate(prompt_sets, 1)
+        for style, label in _VIDEO_STYLE_LABELS.items()
+    ]
 
-사용 방법:
-1. 정책_보고서_전체.pdf를 열어 전체 내용 확인 (권장)
-2. analysis_full.json을 열어 JSON 형태로 확인
-3. images 폴더의 이미지 활용
-4. video_prompts의 프롬프트를 Sora, Runway, Pika 등에 입력
-"""
-        zipf.writestr("README.txt", readme)
-    
-    buffer.seek(0)
-    return buffer.read()
+# 개별 다운로드와 같은 파일명 규칙 (video_<스타일>_<세트번호>.txt)
+_VIDEO_STYLE_FILES = {
+    "documentary": "video_documentary",
+    "cinematic": "video_cinematic",
+    "modern_dynamic": "video_modern"
+}
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def _zip_all_prompts(prompt_sets: List[Dict[str, str]]) -> bytes:
+    """모든 영상 프롬프트 세트를 스타일별 텍스트 파일로 묶은 ZIP 생성 (세트 내용이 같으면 이전 ZIP 재사용)"""
+    buffer = BytesIO()
+    date_time = datetime.now().timetuple()[:6]
+    with ZipFile(buffer, 'w', ZIP_DEFLATED, compresslevel=6) as zipf:
+        for idx, prompt_set in enumerate(prompt_sets, 1):
+            for style, file_stem in _VIDEO_STYLE_FILES.items():
+                text = prompt_set.get(style, '')
+                _write_entry(zipf, f"{file_stem}_{idx}.txt", text.encode("utf-8"), date_time)
+    return buffer.getvalue()
+
+def _export_cache_key(
+    policy: Dict[str, Any],
+    analysis: Dict[str, Any],
+    images: List[bytes],
+    video_prompts: List[str]
+) -> str:
+    """내보내기 결과 캐시 키 (정책·분석·이미지·영상 프롬프트 내용의 blake2b 해시)"""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(_json_bytes(policy))
+    digest.update(_json_bytes(analysis))
+    for img_bytes in images:
+        digest.update(hashlib.blake2b(img_bytes, digest_size=16).digest())
+    for prompt in video_prompts:
+        digest.update(hashlib.blake2b(prompt.encode("utf-8"), digest_size=16).digest())
+    return digest.hexdigest()
+
+# 밑줄로 시작하는 인자는 st.cache_data 해싱에서 제외되므로 cache_key만으로 캐시를 구분
+@st.cache_data(max_entries=8, show_spinner=False)
+def _cached_pdf_report(
+    cache_key: str,
+    _policy: Dict[str, Any],
+    _analysis: Dict[str, Any],
+    _images: List[bytes],
+    _video_prompts: List[str]
+) -> bytes:
+    """내용이 같으면 이전에 만든 PDF 재사용"""
+    return create_pdf_report(
+        _policy,
+        _analysis,
+        images=_images or None,
+        video_prompts=_video_prompts or None
+    )
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def _cached_zip_export(
+    cache_key: str,
+    _policy: Dict[str, Any],
+    _analysis: Dict[str, Any],
+    _images: List[bytes],
+    _video_prompts: List[str]
+) -> bytes:
+    """내용이 같으면 이전에 만든 ZIP 재사용 (PDF는 같은 키의 PDF 캐시에서 가져옴)"""
+    pdf_bytes = _cached_pdf_report(cache_key, _policy, _analysis, _images, _video_prompts)
+    return create_zip_export(
+        _policy,
+        _analysis,
+        images=_images,
+        video_prompts=_video_prompts or None,
+        pdf_bytes=pdf_bytes
+    )
+
+# ==================== 카테고리 검색 ====================
+
+@st.cache_resource
+def get_category_database() -> Mapping[str, Dict[str, List[str]]]:
+    """정책 카테고리 데이터베이스 (대분류 > 중분류 > 세부 항목) - 프로세스당 1회 생성, 읽기 전용"""
+    return MappingProxyType({
+        "환경": {
+            "대기질": ["미세먼지 저감", "대기오염 관리", "실시간 모니터링", "배출가스 규제", "대기질 예보", "미세먼지 신호등", "클린존 조성", "대기오염 총량제", "배출권 거래", "친환경차 보급", "경유차 저감", "공장 배출 관리"],
+            "수질": ["하천 정화", "상수도 개선", "하수처리", "수질 모니터링", "물 절약", "빗물 저장", "하천 생태 복원", "정수장 현대화", "상수도 누수 방지", "지하수 관리", "녹조 관리", "수변 정화"],
+            "폐기물": ["쓰레기 감량", "재활용", "음식물쓰레기", "일회용품 규제", "폐기물 분리배출", "자원순환", "재활용센터", "리필스테이션", "플라스틱 줄이기", "생활쓰레기 종량제", "대형폐기물 수거", "불법투기 단속", "재활용 마을", "업사이클링"],
+            "에너지": ["신재생에너지", "태양광", "풍력", "에너지 효율화", "절전", "에너지 저장", "스마트그리드", "제로에너지 건축", "에너지 자립마을", "수소에너지", "지열에너지", "LED 조명 교체", "건물 에너지관리", "에너지 진단"],
+            "기후변화": ["탄소중립", "온실가스 감축", "기후 적응", "ESG", "탄소배출권", "기후위기 대응", "그린뉴딜", "Net-Zero", "기후변화 교육", "탄소발자국", "기후 취약계층 지원", "폭염 대응", "한파 대비"],
+            "녹지": ["도시숲", "공원 조성", "가로수", "옥상녹화", "벽면녹화", "생태공원", "습지 보호", "생물다양성", "도심 숲길", "미세먼지 차단숲", "녹지축 연결", "나무 심기", "정원도시"]
+        },
+        "교통": {
+            "대중교통": ["버스 노선 개편", "지하철 확충", "환승 편의", "요금 정책", "심야버스", "광역버스", "마을버스", "저상버스", "교통카드 통합", "실시간 도착 정보", "BRT", "버스 전용차로", "환승센터", "대중교통 요금 할인", "무료환승"],
+            "주차": ["공영주차장", "주차난 해소", "불법주차 단속", "공유주차", "주차장 확충", "거주자우선주차", "공공주차장", "주차요금 정책", "노상주차장", "기계식 주차장", "주차정보 시스템", "주차 공간 공유", "주차 앱", "친환경 주차장"],
+            "보행": ["보행자 우선", "보행로 확충", "횡단보도 개선", "무장애 도로", "보행권 보장", "보행환경 개선", "보행섬", "보행신호 연장", "보행 안전", "스쿨존", "실버존", "안전한 통학로", "보행자 전용거리", "보차분리"],
+            "자전거": ["자전거 도로", "공유자전거", "자전거 주차장", "안전 인프라", "자전거 도로망", "따릉이", "자전거 수리소", "자전거 거치대", "자전거 보관소", "자전거 교육", "자전거 안전모", "자전거 우선도로"],
+            "교통안전": ["교통사고 예방", "과속 단속", "신호위반 단속", "음주운전 단속", "교통약자 보호", "교통안전 교육", "어린이보호구역", "노인보호구역", "교통섬", "과속방지턱", "안전표지판", "신호등 개선"],
+            "스마트 교통": ["ITS", "교통정보 시스템", "신호제어 시스템", "교통데이터", "스마트 신호등", "AI 교통관리", "자율주행", "모빌리티", "공유모빌리티", "전기차 충전소", "수소차 충전소", "킥보드 정책"]
+        },
+        "복지": {
+            "노인복지": ["경로당 지원", "돌봄 서비스", "일자리 창출", "건강관리", "치매 예방", "노인 여가", "효도수당", "경로우대", "실버카페", "노인 일자리", "노인 돌봄", "독거노인 지원", "어르신 급식", "노인복지관", "치매 안심센터", "노인 건강검진", "노인 의료지원", "효도관광", "실버타운"],
+            "아동복지": ["보육 지원", "놀이터 확충", "아동학대 예방", "방과후 돌봄", "어린이집 확충", "국공립 어린이집", "보육료 지원", "아동수당", "출산장려금", "육아휴직", "놀이터 안전", "아이돌봄 서비스", "아동급식", "아동보호", "아동센터"],
+            "청년복지": ["주거 지원", "취업 지원", "청년수당", "창업 지원", "청년주택", "청년 일자리", "청년 수당", "청년 공간", "청년 문화", "청년 활동", "청년 정책", "청년 참여", "대학생 지원", "취업 교육", "구직 지원"],
+            "장애인복지": ["장애인 일자리", "편의시설", "이동권 보장", "활동지원", "장애인 복지관", "장애인 수당", "재활치료", "특수교육", "장애인 주차", "저상버스", "장애인 체육", "장애인 문화", "장애인콜택시", "무장애공간"],
+            "여성복지": ["여성 일자리", "경력단절 예방", "여성 안전", "여성 폭력 예방", "여성 복지관", "경단녀 재취업", "여성 창업", "여성 건강", "여성 상담", "한부모 지원", "미혼모 지원", "성평등", "여성 친화도시"],
+            "저소득층 지원": ["기초생활보장", "긴급복지", "생계지원", "의료지원", "교육지원", "주거지원", "복지사각지대", "푸드뱅크", "물가지원", "에너지바우처", "난방비 지원", "취약계층 보호"]
+        },
+        "교육": {
+            "학교교육": ["교육과정 개선", "학교시설 현대화", "무상급식", "돌봄교실", "학교 안전", "교육환경 개선", "스마트 교실", "교육 기자재", "급식 품질", "학교 공기청정기", "학교 냉난방", "학교 화장실", "학교 체육관", "학교 도서관", "교육 복지"],
+            "평생교육": ["성인 교육", "직업훈련", "온라인 강좌", "학습 지원", "평생학습관", "시민대학", "문해교육", "학력인정", "자격증 교육", "재교육", "평생학습도시"],
+            "유아교육": ["유치원 확충", "국공립유치원", "유아 교육비", "유아 돌봄", "누리과정", "유아 안전", "유아 체험", "유아 급식", "유아 놀이"],
+            "특수교육": ["특수학교", "특수학급", "통합교육", "특수교사", "특수교육 지원", "발달장애 교육", "특수교육 기자재", "치료지원"],
+            "방과후·돌봄": ["방과후 학교", "초등돌봄", "아침돌봄", "저녁돌봄", "돌봄교실 확충", "지역아동센터", "다함께돌봄센터", "청소년방과후아카데미"]
+        },
+        "안전": {
+            "재난안전": ["화재 예방", "지진 대비", "태풍 대비", "재난 대응 훈련", "소방시설", "소화기 보급", "화재경보기", "재난문자", "재난대피소", "풍수해 대비", "산사태 예방", "붕괴사고 예방", "가스안전", "전기안전", "승강기 안전", "화학사고 대응", "방사능 대응", "안전문화", "재난안전 교육"],
+            "범죄예방": ["CCTV 확충", "안심귀가", "학교폭력 예방", "성범죄 예방", "범죄 취약지역", "방범등", "비상벨", "여성안심택배함", "여성안심귀갓길", "아동안전", "실종아동 예방", "가정폭력 예방", "스토킹 예방", "디지털성범죄 예방"],
+            "식품안전": ["식품위생", "위생점검", "학교급식 안전", "식중독 예방", "HACCP", "원산지 표시", "식품검사", "위생등급제", "불량식품 단속"],
+            "생활안전": ["어린이놀이터 안전", "승강기 안전", "제품안전", "생활체육 안전", "수상안전", "등산로 안전", "야영장 안전", "레저안전", "시설물 안전점검"],
+            "보건안전": ["감염병 예방", "방역", "공중보건", "의료안전", "정신건강", "자살예방", "코로나19 대응", "예방접종", "건강검진"]
+        },
+        "경제": {
+            "일자리": ["일자리 창출", "구직 지원", "직업 훈련", "고용 안정", "청년일자리", "중장년일자리", "여성일자리", "노인일자리", "장애인일자리", "취업박람회", "일자리센터", "고용보험", "직업상담", "취업알선", "워라밸"],
+            "창업": ["창업 교육", "자금 지원", "멘토링", "공유 오피스", "창업보육센터", "스타트업", "벤처기업", "소상공인 지원", "예비창업자", "1인창업", "청년창업", "여성창업", "시니어창업"],
+            "소상공인": ["소상공인 지원", "전통시장 활성화", "골목상권 보호", "상가임대차 보호", "착한임대인", "배달앱 수수료", "공공배달앱", "제로페이", "소상공인 대출", "컨설팅 지원", "온라인 판로"],
+            "지역경제": ["로컬푸드", "지역화폐", "지역상품권", "지역 특산품", "로컬크리에이터", "도시재생", "구도심 활성화", "전통시장", "재래시장", "상권 활성화", "지역 일자리"],
+            "기업지원": ["중소기업 지원", "기업 유치", "산업단지", "투자유치", "수출지원", "R&D 지원", "기술개발", "기업 컨설팅", "기업 금융", "기업 교육"]
+        },
+        "문화": {
+            "문화시설": ["문화센터", "도서관", "박물관", "미술관", "공연장", "전시관", "문화공간", "북카페", "작은도서관", "마을도서관", "공공도서관", "문화공원", "문화거리"],
+            "문화행사": ["축제", "공연", "전시", "영화제", "음악회", "거리공연", "문화예술제", "지역축제", "전통문화축제", "계절축제", "야간문화행사", "주말공연"],
+            "문화예술": ["예술교육", "문화강좌", "예술단체 지원", "예술인 지원", "공공미술", "문화예술 동아리", "아마추어 예술", "생활예술", "시민예술가", "문화동호회"],
+            "전통문화": ["문화재 보존", "전통문화 계승", "향토문화", "무형문화재", "한옥마을", "전통시장", "전통음식", "전통공예", "민속놀이", "전통의례"],
+            "관광": ["관광지 개발", "관광 홍보", "관광안내", "관광코스", "체험관광", "생태관광", "문화관광", "역사관광", "관광상품", "관광 편의시설"]
+        },
+        "주거": {
+            "공공주택": ["공공임대", "영구임대", "국민임대", "행복주택", "매입임대", "전세임대", "공공분양", "공공주택 확충", "주거복지", "주거급여", "주택바우처"],
+            "주거환경": ["노후주택 개선", "주거환경 개선", "빈집정비", "주택리모델링", "슬레이트 제거", "주택 에너지효율", "단열 개선", "보일러 교체", "주거 안전", "주택방역"],
+            "청년주거": ["청년주택", "청년임대", "청년전세", "셰어하우스", "대학생 기숙사", "청년 주거비 지원", "청년 월세 지원", "청년 전세자금"],
+            "주거취약계층": ["쪽방촌", "고시원", "비닐하우스", "컨테이너", "반지하", "옥탑방", "주거복지센터", "주거상담", "주거비 지원", "긴급주거지원"]
+        },
+        "건설·도시": {
+            "도시계획": ["도시재생", "도심재개발", "뉴타운", "도시 정비", "도시설계", "스마트시티", "친환경도시", "압축도시", "직주근접", "복합용도"],
+            "건설": ["토목공사", "도로건설", "교량건설", "터널공사", "하천정비", "제방", "항만", "인프라", "공공시설", "체육시설 건설"],
+            "도시미관": ["경관 개선", "간판정비", "불법광고물 정비", "가로환경", "도시디자인", "공공디자인", "색채계획", "야간경관", "조명"],
+            "마을만들기": ["주민자치", "마을공동체", "도시재생 뉴딜", "골목길 재생", "마을 주차장", "마을회관", "마을 공동이용시설", "마을 텃밭", "마을 쉼터"]
+        },
+        "농업·농촌": {
+            "농업": ["스마트팜", "친환경농업", "유기농", "도시농업", "주말농장", "텃밭", "농업기술", "농기계", "농업인 교육", "청년농업인", "귀농"],
+            "농촌": ["농촌개발", "농촌관광", "농촌체험", "귀촌", "농촌주택", "농촌복지", "농촌 의료", "농촌 교통", "농촌 일자리", "농촌 인구"],
+            "유통": ["직거래장터", "농산물 직판장", "로컬푸드", "농협판매장", "온라인 판매", "농산물 수출", "농산물 가공", "6차 산업", "푸드플랜"]
+        },
+        "보건·의료": {
+            "공공의료": ["보건소", "공공병원", "의료취약지역", "공공의료 확충", "응급의료", "119구급", "야간진료", "휴일진료", "순회진료"],
+            "건강증진": ["건강검진", "예방접종", "건강교육", "금연", "절주", "영양", "운동", "비만예방", "만성질환 관리", "암검진", "구강검진"],
+            "정신건강": ["정신건강 복지센터", "자살예방", "심리상담", "트라우마 치료", "중독 치료", "스트레스 관리", "우울증", "불안장애", "정신건강 교육"],
+            "의료지원": ["의료비 지원", "취약계층 의료", "난임 지원", "출산 지원", "영유아 건강", "노인 의료", "장애인 의료", "희귀질환", "중증질환"]
+        },
+        "디지털·ICT": {
+            "스마트도시": ["스마트시티", "IoT", "빅데이터", "AI 활용", "디지털트윈", "5G", "공공와이파이", "디지털 인프라", "통신망"],
+            "전자정부": ["전자민원", "온라인 행정", "모바일 앱", "디지털 서비스", "행정정보 공개", "데이터 개방", "공공데이터", "정보화 사업"],
+            "디지털 격차 해소": ["디지털 교육", "정보화 교육", "취약계층 정보화", "시니어 IT교육", "디지털 리터러시", "키오스크 교육", "스마트폰 교육"],
+            "정보보호": ["개인정보 보호", "사이버보안", "정보보안", "해킹 방지", "피싱 예방", "랜섬웨어 대응", "정보보호 교육"]
+        },
+        "체육": {
+            "생활체육": ["체육시설", "체육교실", "동네체육관", "공공체육시설", "수영장", "헬스장", "테니스장", "축구장", "농구장", "배드민턴장", "체육프로그램", "생활체육클럽"],
+            "전문체육": ["선수 육성", "체육 꿈나무", "유망주 발굴", "체육 영재", "엘리트 체육", "전문체육인 지원", "체육대회 개최"],
+            "건강체육": ["걷기운동", "등산", "자전거타기", "국민체조", "건강 프로그램", "건강걷기", "트레킹", "마라톤", "산책로"]
+        },
+        "과학·기술": {
+            "R&D": ["연구개발", "기술개발", "신기술", "산학협력", "연구지원", "연구소", "실험실", "기술사업화", "기술이전"],
+            "혁신": ["혁신성장", "기술혁신", "산업혁신", "디지털 전환", "그린전환", "미래기술", "첨단기술", "4차산업", "바이오", "나노", "로봇"],
+            "과학문화": ["과학관", "과학체험", "과학교육", "과학축제", "메이커스페이스", "과학동아리", "발명교육", "코딩교육"]
+        },
+        "행정·참여": {
+            "주민참여": ["주민자치", "주민참여예산", "마을회의", "주민총회", "공론화", "주민투표", "주민제안", "주민소통", "시민참여"],
+            "민원": ["민원처리", "원스톱 민원", "찾아가는 민원", "무인민원발급기", "민원상담", "고충민원", "민원 만족도"],
+            "열린행정": ["정보공개", "행정투명성", "시민감사관", "옴부즈만", "청렴도", "반부패", "공익신고", "행정혁신"],
+            "소통·홍보": ["시민소통", "정책홍보", "SNS 소통", "언론홍보", "시정소식", "주민설명회", "간담회", "타운홀미팅"]
+        }
+    })
+
+@st.cache_resource
+def _category_index() -> Tuple[Tuple[str, str], ...]:
+    """카테고리 전체 경로 평탄화 인덱스 (소문자 경로, 원본 경로) - 프로세스당 1회 생성"""
+    return tuple(
+        (full_path.lower(), full_path)
+        for main_cat, sub_cats in get_category_database().items()
+        for sub_cat, items in sub_cats.items()
+        for item in items
+        for full_path in (f"{main_cat} > {sub_cat} > {item}",)
+    )
+
+@st.cache_resource
+def _category_haystack() -> Tuple[str, Tuple[int, ...]]:
+    """소문자 경로를 줄바꿈으로 이어 붙인 검색 문자열과 각 경로의 시작 오프셋"""
+    offsets = []
+    pos = 0
+    for lowered, _ in _category_index():
+        offsets.append(pos)
+        pos += len(lowered) + 1
+    return "\n".join(lowered for lowered, _ in _category_index()), tuple(offsets)
+
+@st.cache_data(max_entries=512, show_spinner=False)
+def search_categories(query: str, limit: int = AUTOCOMPLETE_LIMIT + 1) -> List[str]:
+    """카테고리 부분 일치 검색 (str.find로 한 번에 스캔, limit개 찾으면 조기 종료, 같은 검색어는 캐시)"""
+    q = query.lower()
+    if "\n" in q:
+        return []
+    index = _category_index()
+    haystack, offsets = _category_haystack()
+    matches = []
+    pos = haystack.find(q)
+    while pos != -1 and len(matches) < limit:
+        # 일치 위치가 속한 경로로 변환한 뒤 다음 경로부터 이어서 검색
+        i = bisect_right(offsets, pos) - 1
+        matches.append(index[i][1])
+        if i + 1 >= len(offsets):
+            break
+        pos = haystack.find(q, offsets[i + 1])
+    return matches
 
 # ==================== Streamlit UI ====================
 
@@ -1045,7 +1435,8 @@ st.set_page_config(
     initial_sidebar_state="collapsed"  # 모바일 최적화: 기본 축소
 )
 
-st.markdown("""
+# 전역 스타일 (요소는 매 실행마다 다시 그려야 하므로 호출 자체는 캐시하지 않음)
+_APP_CSS = """
 <style>
     .main-header {
         font-size: 2.5rem;
@@ -1076,7 +1467,41 @@ st.markdown("""
         }
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+st.markdown(_APP_CSS, unsafe_allow_html=True)
+
+def _on_category_pick(widget_key: str):
+    """추천/목록에서 고른 카테고리를 다음 실행에 입력란으로 반영"""
+    picked = st.session_state.get(widget_key)
+    if picked:
+        st.session_state.temp_selection = picked
+
+def _on_category_browse_pick():
+    """전체 목록의 대분류/중분류/세부 항목 선택을 카테고리 경로로 반영"""
+    st.session_state.temp_selection = " > ".join(
+        st.session_state[key] for key in ("browse_main", "browse_sub", "browse_item")
+    )
+
+def _go_to_step(tab_idx: int):
+    st.session_state.active_tab = tab_idx
+
+# "새 정책 시작" 시 되돌릴 상태
+_RESET_DEFAULTS = {
+    "current_policy_id": None,
+    "current_analysis": None,
+    "generated_images": [],
+    "video_prompts_3styles": [],
+    "selected_category": "",
+    "temp_selection": "",
+    "workflow_step": "기획",
+    "show_results": False
+}
+
+def _start_new_policy():
+    """현재 작업 상태 초기화 (콜백 후 자동 재실행되므로 st.rerun 불필요)"""
+    # 리스트 기본값이 세션 상태와 공유되지 않도록 복사본으로 갱신
+    st.session_state.update(copy.deepcopy(_RESET_DEFAULTS))
 
 def init_session_state():
     defaults = {
@@ -1088,11 +1513,13 @@ def init_session_state():
         "show_results": False,
         "selected_category": "",
         "temp_selection": "",
-        "active_tab": 0  # 탭 전환용
+        "active_tab": 0,  # 탭 전환용
+        "policy_table_version": 0,  # 사이드바 정책 표 선택 초기화용
+        "policy_table_ids": []  # 직전에 표시한 정책 표의 행별 id
     }
+    # 이후 코드는 이 키들이 항상 있다고 보고 별도 존재 확인을 하지 않음
     for key, value in defaults.items():
-        if key not in st.session_state:
-            st.session_state[key] = value
+        st.session_state.setdefault(key, value)
 
 init_session_state()
 init_database()
@@ -1100,44 +1527,32 @@ init_database()
 st.markdown('<div class="main-header">🏛️ 정세담 정책 프로그램</div>', unsafe_allow_html=True)
 st.markdown('<div class="sub-header">정책 기획·실행·홍보·성과관리 자동화 시스템</div>', unsafe_allow_html=True)
 
-# 사이드바
-with st.sidebar:
-    st.markdown("### 📋 프로세스 단계 (클릭하여 이동)")
-    
-    step_mapping = {
-        "기획": 0,      # 정책 입력 탭
-        "실행": 1,      # AI 분석 생성 탭
-        "홍보": 2,      # 이미지 생성 탭
-        "성과관리": 4   # 결과 및 내보내기 탭
-    }
-    
-    steps = ["기획", "실행", "홍보", "성과관리"]
-    current_step_idx = steps.index(st.session_state.workflow_step)
-    
-    for idx, step in enumerate(steps):
-        if idx < current_step_idx:
-            if st.button(f"✅ {step}", key=f"step_{step}", use_container_width=True):
-                st.session_state.active_tab = step_mapping[step]
-                st.rerun()
-        elif idx == current_step_idx:
-            if st.button(f"▶️ {step} (현재)", key=f"step_{step}", use_container_width=True, type="primary"):
-                st.session_state.active_tab = step_mapping[step]
-                st.rerun()
-        else:
-            if st.button(f"⏸️ {step}", key=f"step_{step}", use_container_width=True, disabled=False):
-                st.session_state.active_tab = step_mapping[step]
-                st.rerun()
-    
-    st.divider()
-    
+def _load_policy(policy_id: int):
+    """저장된 정책의 최신 분석과 이미지를 세션으로 불러오기"""
+    st.session_state.current_policy_id = policy_id
+    latest_analysis = next(iter_policy_contents(policy_id, "analysis"), None)
+    if latest_analysis:
+        st.session_state.current_analysis = latest_analysis['content_data']
+    
+    # 바이트만 보관하고 디코딩은 표시 시점에 (st.image가 직접 처리)
+    st.session_state.generated_images = [
+        {"bytes": m['media_data'], "brief": "loaded"}
+        for m in iter_generated_media(policy_id, "image")
+        if m['media_data']
+    ]
+
+@st.fragment
+def render_policy_browser():
+    """사이드바 날짜 검색 + 저장된 정책 목록 (검색 조작 시 이 영역만 다시 실행)"""
     st.markdown("### 📅 날짜별 정책 검색")
     
     search_type = st.radio("검색 방식", ["전체 보기", "날짜 선택", "날짜 범위"], horizontal=True)
     
     if search_type == "날짜 선택":
         selected_date = st.date_input("날짜 선택", value=date.today())
-        policies = get_policies_by_date(selected_date.strftime("%Y-%m-%d"))
-        st.caption(f"{selected_date.strftime('%Y-%m-%d')} 정책 {len(policies)}건")
+        date_str = selected_date.isoformat()
+        policies = get_policies_by_date(date_str)
+        st.caption(f"{date_str} 정책 {len(policies)}건")
     elif search_type == "날짜 범위":
         col1, col2 = st.columns(2)
         with col1:
@@ -1145,8 +1560,8 @@ with st.sidebar:
         with col2:
             end_date = st.date_input("종료", value=date.today())
         policies = get_policies_by_date_range(
-            start_date.strftime("%Y-%m-%d"),
-            end_date.strftime("%Y-%m-%d")
+            start_date.isoformat(),
+            end_date.isoformat()
         )
         st.caption(f"{len(policies)}건 발견")
     else:
@@ -1156,44 +1571,71 @@ with st.sidebar:
     st.markdown("### 🗂️ 저장된 정책")
     
     if policies:
-        for policy in policies:
-            with st.expander(f"{policy['title'][:20]}..."):
-                st.write(f"📅 {policy['created_at'][:10]}")
-                st.write(f"카테고리: {policy['category']}")
-                st.write(f"대상: {policy['target_audience']}")
-                if st.button("불러오기", key=f"load_{policy['id']}"):
-                    st.session_state.current_policy_id = policy['id']
-                    contents = get_policy_contents(policy['id'])
-                    if contents:
-                        for content in contents:
-                            if content['content_type'] == 'analysis':
-                                st.session_state.current_analysis = content['content_data']
-                    
-                    media = get_generated_media(policy['id'])
-                    st.session_state.generated_images = []
-                    
-                    for m in media:
-                        if m['media_type'] == 'image' and m['media_data']:
-                            img = Image.open(BytesIO(m['media_data']))
-                            st.session_state.generated_images.append({
-                                "image": img,
-                                "bytes": m['media_data'],
-                                "brief": "loaded"
-                            })
-                    
-                    st.success(f"✅ 정책 불러오기 완료!")
-                    st.rerun()
+        st.caption("행을 선택하면 정책을 불러옵니다")
+        # 선택된 행 번호는 사용자가 본 (직전 실행의) 표 기준이므로, 새로 조회한 목록이 아니라
+        # 그때 표시한 id 목록으로 해석 (저장·캐시 만료로 목록이 바뀌어도 다른 정책을 불러오지 않음)
+        shown_ids = st.session_state.policy_table_ids
+        st.session_state.policy_table_ids = [policy['id'] for policy in policies]
+        event = st.dataframe(
+            [
+                {
+                    "제목": policy['title'],
+                    "날짜": policy['created_at'][:10],
+                    "카테고리": policy['category'],
+                    "대상": policy['target_audience']
+                }
+                for policy in policies
+            ],
+            hide_index=True,
+            use_container_width=True,
+            on_select="rerun",
+            selection_mode="single-row",
+            # 불러온 뒤 키를 바꿔 선택 상태를 초기화
+            key=f"policy_table_{st.session_state.policy_table_version}"
+        )
+        
+        if event.selection.rows:
+            row = event.selection.rows[0]
+            if row < len(shown_ids):
+                _load_policy(shown_ids[row])
+                st.toast("✅ 정책 불러오기 완료!")
+            st.session_state.policy_table_version += 1
+            st.rerun()
     else:
         st.info("저장된 정책이 없습니다")
+
+# 사이드바
+with st.sidebar:
+    st.markdown("### 📋 프로세스 단계 (클릭하여 이동)")
+    
+    step_mapping = {
+        "기획": 0,      # 정책 입력 탭
+        "실행": 1,      # AI 분석 생성 탭
+        "홍보": 2,      # 이미지 생성 탭
+        "성과관리": 4   # 결과 및 내보내기 탭
+    }
+    
+    steps = ["기획", "실행", "홍보", "성과관리"]
+    current_step_idx = steps.index(st.session_state.workflow_step)
+    
+    for idx, step in enumerate(steps):
+        if idx < current_step_idx:
+            st.button(f"✅ {step}", key=f"step_{step}", use_container_width=True,
+                      on_click=_go_to_step, args=(step_mapping[step],))
+        elif idx == current_step_idx:
+            st.button(f"▶️ {step} (현재)", key=f"step_{step}", use_container_width=True, type="primary",
+                      on_click=_go_to_step, args=(step_mapping[step],))
+        else:
+            st.button(f"⏸️ {step}", key=f"step_{step}", use_container_width=True, disabled=False,
+                      on_click=_go_to_step, args=(step_mapping[step],))
+    
+    st.divider()
+    
+    render_policy_browser()
     
     st.divider()
     
-    if st.button("🆕 새 정책 시작", use_container_width=True):
-        for key in ["current_policy_id", "current_analysis", "generated_images", "video_prompts_3styles", "selected_category", "temp_selection"]:
-            st.session_state[key] = [] if "images" in key or "prompts" in key else ("" if "category" in key or "selection" in key else None)
-        st.session_state.workflow_step = "기획"
-        st.session_state.show_results = False
-        st.rerun()
+    st.button("🆕 새 정책 시작", use_container_width=True, on_click=_start_new_policy)
 
 # 메인 탭
 tab1, tab2, tab3, tab4, tab5 = st.tabs([
@@ -1216,109 +1658,8 @@ with tab1:
             help="정책의 핵심을 담은 명확한 제목"
         )
         
-        # 카테고리 데이터베이스
-        category_database = {
-            "환경": {
-                "대기질": ["미세먼지 저감", "대기오염 관리", "실시간 모니터링", "배출가스 규제", "대기질 예보", "미세먼지 신호등", "클린존 조성", "대기오염 총량제", "배출권 거래", "친환경차 보급", "경유차 저감", "공장 배출 관리"],
-                "수질": ["하천 정화", "상수도 개선", "하수처리", "수질 모니터링", "물 절약", "빗물 저장", "하천 생태 복원", "정수장 현대화", "상수도 누수 방지", "지하수 관리", "녹조 관리", "수변 정화"],
-                "폐기물": ["쓰레기 감량", "재활용", "음식물쓰레기", "일회용품 규제", "폐기물 분리배출", "자원순환", "재활용센터", "리필스테이션", "플라스틱 줄이기", "생활쓰레기 종량제", "대형폐기물 수거", "불법투기 단속", "재활용 마을", "업사이클링"],
-                "에너지": ["신재생에너지", "태양광", "풍력", "에너지 효율화", "절전", "에너지 저장", "스마트그리드", "제로에너지 건축", "에너지 자립마을", "수소에너지", "지열에너지", "LED 조명 교체", "건물 에너지관리", "에너지 진단"],
-                "기후변화": ["탄소중립", "온실가스 감축", "기후 적응", "ESG", "탄소배출권", "기후위기 대응", "그린뉴딜", "Net-Zero", "기후변화 교육", "탄소발자국", "기후 취약계층 지원", "폭염 대응", "한파 대비"],
-                "녹지": ["도시숲", "공원 조성", "가로수", "옥상녹화", "벽면녹화", "생태공원", "습지 보호", "생물다양성", "도심 숲길", "미세먼지 차단숲", "녹지축 연결", "나무 심기", "정원도시"]
-            },
-            "교통": {
-                "대중교통": ["버스 노선 개편", "지하철 확충", "환승 편의", "요금 정책", "심야버스", "광역버스", "마을버스", "저상버스", "교통카드 통합", "실시간 도착 정보", "BRT", "버스 전용차로", "환승센터", "대중교통 요금 할인", "무료환승"],
-                "주차": ["공영주차장", "주차난 해소", "불법주차 단속", "공유주차", "주차장 확충", "거주자우선주차", "공공주차장", "주차요금 정책", "노상주차장", "기계식 주차장", "주차정보 시스템", "주차 공간 공유", "주차 앱", "친환경 주차장"],
-                "보행": ["보행자 우선", "보행로 확충", "횡단보도 개선", "무장애 도로", "보행권 보장", "보행환경 개선", "보행섬", "보행신호 연장", "보행 안전", "스쿨존", "실버존", "안전한 통학로", "보행자 전용거리", "보차분리"],
-                "자전거": ["자전거 도로", "공유자전거", "자전거 주차장", "안전 인프라", "자전거 도로망", "따릉이", "자전거 수리소", "자전거 거치대", "자전거 보관소", "자전거 교육", "자전거 안전모", "자전거 우선도로"],
-                "교통안전": ["교통사고 예방", "과속 단속", "신호위반 단속", "음주운전 단속", "교통약자 보호", "교통안전 교육", "어린이보호구역", "노인보호구역", "교통섬", "과속방지턱", "안전표지판", "신호등 개선"],
-                "스마트 교통": ["ITS", "교통정보 시스템", "신호제어 시스템", "교통데이터", "스마트 신호등", "AI 교통관리", "자율주행", "모빌리티", "공유모빌리티", "전기차 충전소", "수소차 충전소", "킥보드 정책"]
-            },
-            "복지": {
-                "노인복지": ["경로당 지원", "돌봄 서비스", "일자리 창출", "건강관리", "치매 예방", "노인 여가", "효도수당", "경로우대", "실버카페", "노인 일자리", "노인 돌봄", "독거노인 지원", "어르신 급식", "노인복지관", "치매 안심센터", "노인 건강검진", "노인 의료지원", "효도관광", "실버타운"],
-                "아동복지": ["보육 지원", "놀이터 확충", "아동학대 예방", "방과후 돌봄", "어린이집 확충", "국공립 어린이집", "보육료 지원", "아동수당", "출산장려금", "육아휴직", "놀이터 안전", "아이돌봄 서비스", "아동급식", "아동보호", "아동센터"],
-                "청년복지": ["주거 지원", "취업 지원", "청년수당", "창업 지원", "청년주택", "청년 일자리", "청년 수당", "청년 공간", "청년 문화", "청년 활동", "청년 정책", "청년 참여", "대학생 지원", "취업 교육", "구직 지원"],
-                "장애인복지": ["장애인 일자리", "편의시설", "이동권 보장", "활동지원", "장애인 복지관", "장애인 수당", "재활치료", "특수교육", "장애인 주차", "저상버스", "장애인 체육", "장애인 문화", "장애인콜택시", "무장애공간"],
-                "여성복지": ["여성 일자리", "경력단절 예방", "여성 안전", "여성 폭력 예방", "여성 복지관", "경단녀 재취업", "여성 창업", "여성 건강", "여성 상담", "한부모 지원", "미혼모 지원", "성평등", "여성 친화도시"],
-                "저소득층 지원": ["기초생활보장", "긴급복지", "생계지원", "의료지원", "교육지원", "주거지원", "복지사각지대", "푸드뱅크", "물가지원", "에너지바우처", "난방비 지원", "취약계층 보호"]
-            },
-            "교육": {
-                "학교교육": ["교육과정 개선", "학교시설 현대화", "무상급식", "돌봄교실", "학교 안전", "교육환경 개선", "스마트 교실", "교육 기자재", "급식 품질", "학교 공기청정기", "학교 냉난방", "학교 화장실", "학교 체육관", "학교 도서관", "교육 복지"],
-                "평생교육": ["성인 교육", "직업훈련", "온라인 강좌", "학습 지원", "평생학습관", "시민대학", "문해교육", "학력인정", "자격증 교육", "재교육", "평생학습도시"],
-                "유아교육": ["유치원 확충", "국공립유치원", "유아 교육비", "유아 돌봄", "누리과정", "유아 안전", "유아 체험", "유아 급식", "유아 놀이"],
-                "특수교육": ["특수학교", "특수학급", "통합교육", "특수교사", "특수교육 지원", "발달장애 교육", "특수교육 기자재", "치료지원"],
-                "방과후·돌봄": ["방과후 학교", "초등돌봄", "아침돌봄", "저녁돌봄", "돌봄교실 확충", "지역아동센터", "다함께돌봄센터", "청소년방과후아카데미"]
-            },
-            "안전": {
-                "재난안전": ["화재 예방", "지진 대비", "태풍 대비", "재난 대응 훈련", "소방시설", "소화기 보급", "화재경보기", "재난문자", "재난대피소", "풍수해 대비", "산사태 예방", "붕괴사고 예방", "가스안전", "전기안전", "승강기 안전", "화학사고 대응", "방사능 대응", "안전문화", "재난안전 교육"],
-                "범죄예방": ["CCTV 확충", "안심귀가", "학교폭력 예방", "성범죄 예방", "범죄 취약지역", "방범등", "비상벨", "여성안심택배함", "여성안심귀갓길", "아동안전", "실종아동 예방", "가정폭력 예방", "스토킹 예방", "디지털성범죄 예방"],
-                "식품안전": ["식품위생", "위생점검", "학교급식 안전", "식중독 예방", "HACCP", "원산지 표시", "식품검사", "위생등급제", "불량식품 단속"],
-                "생활안전": ["어린이놀이터 안전", "승강기 안전", "제품안전", "생활체육 안전", "수상안전", "등산로 안전", "야영장 안전", "레저안전", "시설물 안전점검"],
-                "보건안전": ["감염병 예방", "방역", "공중보건", "의료안전", "정신건강", "자살예방", "코로나19 대응", "예방접종", "건강검진"]
-            },
-            "경제": {
-                "일자리": ["일자리 창출", "구직 지원", "직업 훈련", "고용 안정", "청년일자리", "중장년일자리", "여성일자리", "노인일자리", "장애인일자리", "취업박람회", "일자리센터", "고용보험", "직업상담", "취업알선", "워라밸"],
-                "창업": ["창업 교육", "자금 지원", "멘토링", "공유 오피스", "창업보육센터", "스타트업", "벤처기업", "소상공인 지원", "예비창업자", "1인창업", "청년창업", "여성창업", "시니어창업"],
-                "소상공인": ["소상공인 지원", "전통시장 활성화", "골목상권 보호", "상가임대차 보호", "착한임대인", "배달앱 수수료", "공공배달앱", "제로페이", "소상공인 대출", "컨설팅 지원", "온라인 판로"],
-                "지역경제": ["로컬푸드", "지역화폐", "지역상품권", "지역 특산품", "로컬크리에이터", "도시재생", "구도심 활성화", "전통시장", "재래시장", "상권 활성화", "지역 일자리"],
-                "기업지원": ["중소기업 지원", "기업 유치", "산업단지", "투자유치", "수출지원", "R&D 지원", "기술개발", "기업 컨설팅", "기업 금융", "기업 교육"]
-            },
-            "문화": {
-                "문화시설": ["문화센터", "도서관", "박물관", "미술관", "공연장", "전시관", "문화공간", "북카페", "작은도서관", "마을도서관", "공공도서관", "문화공원", "문화거리"],
-                "문화행사": ["축제", "공연", "전시", "영화제", "음악회", "거리공연", "문화예술제", "지역축제", "전통문화축제", "계절축제", "야간문화행사", "주말공연"],
-                "문화예술": ["예술교육", "문화강좌", "예술단체 지원", "예술인 지원", "공공미술", "문화예술 동아리", "아마추어 예술", "생활예술", "시민예술가", "문화동호회"],
-                "전통문화": ["문화재 보존", "전통문화 계승", "향토문화", "무형문화재", "한옥마을", "전통시장", "전통음식", "전통공예", "민속놀이", "전통의례"],
-                "관광": ["관광지 개발", "관광 홍보", "관광안내", "관광코스", "체험관광", "생태관광", "문화관광", "역사관광", "관광상품", "관광 편의시설"]
-            },
-            "주거": {
-                "공공주택": ["공공임대", "영구임대", "국민임대", "행복주택", "매입임대", "전세임대", "공공분양", "공공주택 확충", "주거복지", "주거급여", "주택바우처"],
-                "주거환경": ["노후주택 개선", "주거환경 개선", "빈집정비", "주택리모델링", "슬레이트 제거", "주택 에너지효율", "단열 개선", "보일러 교체", "주거 안전", "주택방역"],
-                "청년주거": ["청년주택", "청년임대", "청년전세", "셰어하우스", "대학생 기숙사", "청년 주거비 지원", "청년 월세 지원", "청년 전세자금"],
-                "주거취약계층": ["쪽방촌", "고시원", "비닐하우스", "컨테이너", "반지하", "옥탑방", "주거복지센터", "주거상담", "주거비 지원", "긴급주거지원"]
-            },
-            "건설·도시": {
-                "도시계획": ["도시재생", "도심재개발", "뉴타운", "도시 정비", "도시설계", "스마트시티", "친환경도시", "압축도시", "직주근접", "복합용도"],
-                "건설": ["토목공사", "도로건설", "교량건설", "터널공사", "하천정비", "제방", "항만", "인프라", "공공시설", "체육시설 건설"],
-                "도시미관": ["경관 개선", "간판정비", "불법광고물 정비", "가로환경", "도시디자인", "공공디자인", "색채계획", "야간경관", "조명"],
-                "마을만들기": ["주민자치", "마을공동체", "도시재생 뉴딜", "골목길 재생", "마을 주차장", "마을회관", "마을 공동이용시설", "마을 텃밭", "마을 쉼터"]
-            },
-            "농업·농촌": {
-                "농업": ["스마트팜", "친환경농업", "유기농", "도시농업", "주말농장", "텃밭", "농업기술", "농기계", "농업인 교육", "청년농업인", "귀농"],
-                "농촌": ["농촌개발", "농촌관광", "농촌체험", "귀촌", "농촌주택", "농촌복지", "농촌 의료", "농촌 교통", "농촌 일자리", "농촌 인구"],
-                "유통": ["직거래장터", "농산물 직판장", "로컬푸드", "농협판매장", "온라인 판매", "농산물 수출", "농산물 가공", "6차 산업", "푸드플랜"]
-            },
-            "보건·의료": {
-                "공공의료": ["보건소", "공공병원", "의료취약지역", "공공의료 확충", "응급의료", "119구급", "야간진료", "휴일진료", "순회진료"],
-                "건강증진": ["건강검진", "예방접종", "건강교육", "금연", "절주", "영양", "운동", "비만예방", "만성질환 관리", "암검진", "구강검진"],
-                "정신건강": ["정신건강 복지센터", "자살예방", "심리상담", "트라우마 치료", "중독 치료", "스트레스 관리", "우울증", "불안장애", "정신건강 교육"],
-                "의료지원": ["의료비 지원", "취약계층 의료", "난임 지원", "출산 지원", "영유아 건강", "노인 의료", "장애인 의료", "희귀질환", "중증질환"]
-            },
-            "디지털·ICT": {
-                "스마트도시": ["스마트시티", "IoT", "빅데이터", "AI 활용", "디지털트윈", "5G", "공공와이파이", "디지털 인프라", "통신망"],
-                "전자정부": ["전자민원", "온라인 행정", "모바일 앱", "디지털 서비스", "행정정보 공개", "데이터 개방", "공공데이터", "정보화 사업"],
-                "디지털 격차 해소": ["디지털 교육", "정보화 교육", "취약계층 정보화", "시니어 IT교육", "디지털 리터러시", "키오스크 교육", "스마트폰 교육"],
-                "정보보호": ["개인정보 보호", "사이버보안", "정보보안", "해킹 방지", "피싱 예방", "랜섬웨어 대응", "정보보호 교육"]
-            },
-            "체육": {
-                "생활체육": ["체육시설", "체육교실", "동네체육관", "공공체육시설", "수영장", "헬스장", "테니스장", "축구장", "농구장", "배드민턴장", "체육프로그램", "생활체육클럽"],
-                "전문체육": ["선수 육성", "체육 꿈나무", "유망주 발굴", "체육 영재", "엘리트 체육", "전문체육인 지원", "체육대회 개최"],
-                "건강체육": ["걷기운동", "등산", "자전거타기", "국민체조", "건강 프로그램", "건강걷기", "트레킹", "마라톤", "산책로"]
-            },
-            "과학·기술": {
-                "R&D": ["연구개발", "기술개발", "신기술", "산학협력", "연구지원", "연구소", "실험실", "기술사업화", "기술이전"],
-                "혁신": ["혁신성장", "기술혁신", "산업혁신", "디지털 전환", "그린전환", "미래기술", "첨단기술", "4차산업", "바이오", "나노", "로봇"],
-                "과학문화": ["과학관", "과학체험", "과학교육", "과학축제", "메이커스페이스", "과학동아리", "발명교육", "코딩교육"]
-            },
-            "행정·참여": {
-                "주민참여": ["주민자치", "주민참여예산", "마을회의", "주민총회", "공론화", "주민투표", "주민제안", "주민소통", "시민참여"],
-                "민원": ["민원처리", "원스톱 민원", "찾아가는 민원", "무인민원발급기", "민원상담", "고충민원", "민원 만족도"],
-                "열린행정": ["정보공개", "행정투명성", "시민감사관", "옴부즈만", "청렴도", "반부패", "공익신고", "행정혁신"],
-                "소통·홍보": ["시민소통", "정책홍보", "SNS 소통", "언론홍보", "시정소식", "주민설명회", "간담회", "타운홀미팅"]
-            }
-        }
-        
         # 선택 버튼이 눌렸을 때
-        if "temp_selection" in st.session_state and st.session_state.temp_selection:
+        if st.session_state.temp_selection:
             st.session_state.selected_category = st.session_state.temp_selection
             st.session_state.temp_selection = ""
         
@@ -1336,55 +1677,43 @@ with tab1:
         
         # 실시간 자동완성 (모바일/PC 분기)
         if policy_category and len(policy_category) > 0:
-            autocomplete_suggestions = []
-            
-            for main_cat, sub_cats in category_database.items():
-                for sub_cat, items in sub_cats.items():
-                    for item in items:
-                        full_path = f"{main_cat} > {sub_cat} > {item}"
-                        if policy_category.lower() in full_path.lower():
-                            autocomplete_suggestions.append(full_path)
+            autocomplete_suggestions = search_categories(policy_category)
+            has_more = len(autocomplete_suggestions) > AUTOCOMPLETE_LIMIT
             
             if autocomplete_suggestions:
                 st.markdown("##### 💡 자동완성 추천")
-                st.caption(f"{len(autocomplete_suggestions)}개 항목 발견 (최대 10개 표시)")
+                if has_more:
+                    st.caption(f"{AUTOCOMPLETE_LIMIT}개 이상 발견 (최대 {AUTOCOMPLETE_LIMIT}개 표시)")
+                else:
+                    st.caption(f"{len(autocomplete_suggestions)}개 항목 발견")
                 
-                # 자동완성 표시
-                for idx, suggestion in enumerate(autocomplete_suggestions[:10]):
-                    cols = st.columns([5, 1])
-                    with cols[0]:
-                        st.markdown(f"✨ {suggestion}")
-                    with cols[1]:
-                        if st.button("선택", key=f"autocomplete_{idx}", use_container_width=True):
-                            st.session_state.temp_selection = suggestion
-                            st.rerun()
+                # 자동완성 표시 (선택 즉시 콜백으로 반영)
+                st.radio(
+                    "추천 카테고리",
+                    autocomplete_suggestions[:AUTOCOMPLETE_LIMIT],
+                    index=None,
+                    format_func=lambda suggestion: f"✨ {suggestion}",
+                    key="autocomplete_radio",
+                    on_change=_on_category_pick,
+                    args=("autocomplete_radio",),
+                    label_visibility="collapsed"
+                )
                 
-                if len(autocomplete_suggestions) > 10:
-                    st.caption(f"+ {len(autocomplete_suggestions) - 10}개 더 있습니다.")
+                if has_more:
+                    st.caption("+ 더 있습니다. 검색어를 구체적으로 입력하세요.")
         else:
             # 입력이 없을 때는 도움말만 표시 (모바일 최적화)
             st.caption("💡 카테고리 입력 시 자동완성이 표시됩니다. 또는 아래 전체 카테고리에서 선택하세요.")
         
-        # 전체 카테고리 리스트 표시 (expander로)
-        with st.expander("📚 전체 카테고리 목록 보기 (클릭하여 선택)"):
-            st.caption("원하는 세부 항목을 클릭하면 자동으로 입력됩니다")
+        # 전체 카테고리 목록 (expander는 접혀 있어도 본문이 실행되므로 토글이 켜졌을 때만 그림)
+        if st.toggle("📚 전체 카테고리 목록 보기 (선택하여 입력)", key="show_all_cat"):
+            st.caption("대분류 → 중분류 → 세부 항목을 고른 뒤 선택을 누르면 자동으로 입력됩니다")
             
-            for main_cat, sub_cats in category_database.items():
-                st.markdown(f"#### {main_cat}")
-                for sub_cat, items in sub_cats.items():
-                    st.markdown(f"**{sub_cat}**")
-                    
-                    # 세부 항목마다 선택 버튼
-                    for item in items:
-                        cols = st.columns([4, 1])
-                        with cols[0]:
-                            st.write(f"• {item}")
-                        with cols[1]:
-                            if st.button("선택", key=f"select_full_{main_cat}_{sub_cat}_{item}", use_container_width=True):
-                                st.session_state.temp_selection = f"{main_cat} > {sub_cat} > {item}"
-                                st.rerun()
-                    
-                    st.divider()
+            category_db = get_category_database()
+            browse_main = st.selectbox("대분류", list(category_db), key="browse_main")
+            browse_sub = st.selectbox("중분류", list(category_db[browse_main]), key="browse_sub")
+            st.selectbox("세부 항목", category_db[browse_main][browse_sub], key="browse_item")
+            st.button("선택", key="browse_select", on_click=_on_category_browse_pick, use_container_width=True)
         
         target_audience = st.selectbox(
             "주요 대상 *",
@@ -1444,7 +1773,8 @@ with tab1:
                 st.error("정책 제목과 설명은 필수입니다")
             else:
                 try:
-                    if not st.session_state.current_policy_id:
+                    created_policy = not st.session_state.current_policy_id
+                    if created_policy:
                         policy_id = create_policy(
                             title=policy_title,
                             category=policy_category,
@@ -1454,22 +1784,28 @@ with tab1:
                         st.session_state.current_policy_id = policy_id
                     
                     with st.spinner("AI가 정책을 분석하고 있습니다... (30-60초 소요)"):
-                        analysis, raw = generate_policy_analysis(
-                            title=policy_title,
-                            category=policy_category,
-                            target_audience=target_audience,
-                            description=policy_description,
-                            keywords=keywords,
-                            constraints=constraints
-                        )
+                        try:
+                            analysis, raw = _cached_analysis(
+                                title=policy_title,
+                                category=policy_category,
+                                target_audience=target_audience,
+                                description=policy_description,
+                                keywords=keywords,
+                                constraints=constraints
+                            )
+                        except ValueError:
+                            analysis = None
                         
                         if analysis:
+                            # 입력이 같아 캐시된 결과가 이미 이 정책의 현재 분석이면 같은 행을 다시 저장하지 않음
+                            already_saved = not created_policy and analysis == st.session_state.current_analysis
                             st.session_state.current_analysis = analysis
-                            save_policy_content(
-                                st.session_state.current_policy_id,
-                                "analysis",
-                                analysis
-                            )
+                            if not already_saved:
+                                save_policy_content(
+                                    st.session_state.current_policy_id,
+                                    "analysis",
+                                    analysis
+                                )
                             st.success("✅ AI 분석이 완료되었습니다!")
                             st.session_state.show_results = True
                             st.session_state.workflow_step = "홍보"
@@ -1652,88 +1988,94 @@ with tab2:
     else:
         st.info("먼저 '정책 입력' 탭에서 정책 정보를 입력하고 AI 분석을 생성해주세요.")
 
-with tab3:
+@st.fragment
+def render_image_tab():
+    """이미지 생성 탭 (버튼 조작 시 이 탭만 다시 실행)"""
     st.markdown("### 3️⃣ 이미지 자동 생성")
     
     if st.session_state.current_analysis and "content_briefs" in st.session_state.current_analysis:
         briefs = st.session_state.current_analysis["content_briefs"]
         
+        preview_mode = st.toggle(
+            f"⚡ 빠른 미리보기 ({PREVIEW_IMAGE_SIZE} · {PREVIEW_IMAGE_QUALITY})",
+            value=True,
+            help="미리보기는 가장 빠른 설정으로 생성합니다. 최종 이미지는 끄고 크기와 품질을 선택하세요."
+        )
+        
         col1, col2, col3 = st.columns(3)
         
         with col1:
-            image_size = st.selectbox("이미지 크기", IMAGE_SIZES)
+            image_size = st.selectbox("이미지 크기", IMAGE_SIZES, disabled=preview_mode)
         
         with col2:
-            image_quality = st.selectbox("품질", ["standard", "hd"])
+            image_quality = st.selectbox("품질", ["standard", "hd"], disabled=preview_mode)
         
         with col3:
             num_images = st.number_input("생성 개수", min_value=1, max_value=4, value=2)
         
-        st.divider()
+        # 미리보기는 실제로 요청하는 크기·품질로 바꿔 두고, 생성과 저장 기록에 같은 값을 사용
+        if preview_mode:
+            image_size, image_quality = PREVIEW_IMAGE_SIZE, PREVIEW_IMAGE_QUALITY
         
-        col1, col2 = st.columns(2)
+        st.divider()
         
-        with col1:
-            if st.button("🖼️ 이미지 1 생성", use_container_width=True):
-                if "image_brief_1" in briefs:
-                    with st.spinner("이미지를 생성하고 있습니다... (20-40초)"):
-                        result = generate_policy_image(
-                            briefs["image_brief_1"],
-                            size=image_size,
-                            quality=image_quality
-                        )
-                        if result:
-                            img, img_bytes = result
-                            st.session_state.generated_images.append({
-                                "image": img,
-                                "bytes": img_bytes,
-                                "brief": "image_brief_1"
-                            })
-                            
-                            if st.session_state.current_policy_id:
-                                save_generated_media(
-                                    st.session_state.current_policy_id,
-                                    "image",
-                                    img_bytes,
-                                    generate_image_prompt(briefs["image_brief_1"]),
-                                    {"size": image_size, "quality": image_quality}
-                                )
-                            
-                            st.success("✅ 이미지 1 생성 완료!")
-                            st.rerun()
-                        else:
-                            st.error("이미지 생성에 실패했습니다")
+        # 생성 개수만큼 브리프를 순환하며 한 번에 동시 생성
+        brief_keys = sorted(
+            (key for key in briefs if key.startswith("image_brief_") and key.rsplit("_", 1)[-1].isdigit()),
+            key=lambda key: int(key.rsplit("_", 1)[-1])
+        )
         
-        with col2:
-            if st.button("🖼️ 이미지 2 생성", use_container_width=True):
-                if "image_brief_2" in briefs:
-                    with st.spinner("이미지를 생성하고 있습니다... (20-40초)"):
-                        result = generate_policy_image(
-                            briefs["image_brief_2"],
-                            size=image_size,
-                            quality=image_quality
-                        )
-                        if result:
-                            img, img_bytes = result
-                            st.session_state.generated_images.append({
-                                "image": img,
-                                "bytes": img_bytes,
-                                "brief": "image_brief_2"
-                            })
-                            
-                            if st.session_state.current_policy_id:
-                                save_generated_media(
-                                    st.session_state.current_policy_id,
-                                    "image",
-                                    img_bytes,
-                                    generate_image_prompt(briefs["image_brief_2"]),
-                                    {"size": image_size, "quality": image_quality}
-                                )
-                            
-                            st.success("✅ 이미지 2 생성 완료!")
-                            st.rerun()
-                        else:
-                            st.error("이미지 생성에 실패했습니다")
+        if st.button("🖼️ 이미지 일괄 생성", use_container_width=True, type="primary", disabled=not brief_keys):
+            targets = [brief_keys[i % len(brief_keys)] for i in range(num_images)]
+            # 브리프별 프롬프트는 한 번만 조합해 같은 브리프를 쓰는 이미지끼리 재사용
+            prompt_by_key = {key: resolve_image_prompt(st.session_state.current_analysis, key) for key in brief_keys}
+            prompts = [prompt_by_key[key] for key in targets]
+            
+            # 이미지별 자리를 미리 확보하고 완료되는 순서대로 바로 표시
+            preview_cols = st.columns(2)
+            placeholders = [preview_cols[i % 2].empty() for i in range(num_images)]
+            results = []
+            
+            with st.spinner(f"이미지 {num_images}장을 동시에 생성하고 있습니다... (20-40초)"):
+                for idx, img_bytes in batch_generate_images(prompts, size=image_size, quality=image_quality):
+                    # 표시용 변환·표시가 실패해도 이미 생성된 이미지는 세션·DB에 그대로 보관
+                    try:
+                        thumb = make_thumbnail(img_bytes)
+                    except Exception:
+                        thumb = img_bytes
+                    results.append((idx, img_bytes, thumb))
+                    try:
+                        placeholders[idx].image(thumb, caption=f"이미지 {idx + 1} 완료", use_container_width=True)
+                    except Exception:
+                        placeholders[idx].warning(f"이미지 {idx + 1} 미리보기를 표시할 수 없습니다")
+            
+            # 아래 갤러리가 이어서 모두 그리므로 임시 표시는 비움
+            for placeholder in placeholders:
+                placeholder.empty()
+            results.sort(key=lambda result: result[0])
+            
+            # 세션에는 PNG 바이트와 표시용 썸네일만 보관
+            for idx, img_bytes, thumb in results:
+                st.session_state.generated_images.append({
+                    "bytes": img_bytes,
+                    "thumb": thumb,
+                    "brief": targets[idx]
+                })
+                
+                if st.session_state.current_policy_id:
+                    save_generated_media(
+                        st.session_state.current_policy_id,
+                        "image",
+                        img_bytes,
+                        prompts[idx],
+                        {"size": image_size, "quality": image_quality, "preview": preview_mode}
+                    )
+            
+            # 아래 갤러리가 같은 실행에서 새 이미지를 그리므로 st.rerun 불필요
+            if results:
+                st.success(f"✅ 이미지 {len(results)}장 생성 완료!")
+            else:
+                st.error("이미지 생성에 실패했습니다")
         
         st.divider()
         
@@ -1743,13 +2085,22 @@ with tab3:
             cols = st.columns(2)
             for idx, img_data in enumerate(st.session_state.generated_images):
                 with cols[idx % 2]:
-                    st.image(img_data["image"], use_column_width=True)
+                    # 썸네일은 항목당 한 번만 만들어 세션에 보관 (만들 수 없으면 원본 바이트로 표시)
+                    if "thumb" not in img_data:
+                        try:
+                            img_data["thumb"] = make_thumbnail(img_data["bytes"])
+                        except Exception:
+                            img_data["thumb"] = img_data["bytes"]
+                    # 손상된 이미지 하나 때문에 탭 전체(다른 이미지의 다운로드 버튼 포함)가 멈추지 않도록
+                    try:
+                        st.image(img_data["thumb"], use_container_width=True)
+                    except Exception:
+                        st.warning("미리보기를 표시할 수 없는 이미지입니다")
                     st.caption(f"이미지 {idx+1}")
                     
-                    buffer = BytesIO(img_data["bytes"])
                     st.download_button(
                         f"💾 이미지 {idx+1} 다운로드",
-                        buffer,
+                        img_data["bytes"],
                         file_name=f"policy_image_{idx+1}.png",
                         mime="image/png",
                         key=f"download_img_{idx}"
@@ -1760,7 +2111,45 @@ with tab3:
     else:
         st.info("먼저 AI 분석을 생성해주세요")
 
-with tab4:
+with tab3:
+    render_image_tab()
+
+@st.fragment
+def render_video_prompt_set(set_idx: int, prompt_set: Dict[str, str]):
+    """영상 프롬프트 세트 1개 (스타일별 expander는 접힌 상태로 시작, 조작 시 이 세트만 다시 실행)"""
+    st.markdown(f"#### 세트 {set_idx + 1}")
+    
+    # 스타일 1: 다큐멘터리
+    with st.expander("🎥 스타일 1: 다큐멘터리 리얼리즘", expanded=False):
+        st.code(prompt_set["documentary"], language="text")
+    
+    # 스타일 2: 시네마틱
+    with st.expander("🎬 스타일 2: 시네마틱 드라마", expanded=False):
+        st.code(prompt_set["cinematic"], language="text")
+    
+    # 스타일 3: 모던 다이내믹
+    with st.expander("⚡ 스타일 3: 모던 다이내믹", expanded=False):
+        st.code(prompt_set["modern_dynamic"], language="text")
+    
+    # 개별 다운로드 버튼은 토글을 켰을 때만 렌더링 (기본 경로는 상단의 ZIP 버튼 1개)
+    if st.toggle("💾 개별 다운로드", key=f"show_video_downloads_{set_idx}"):
+        cols = st.columns(len(_VIDEO_STYLE_FILES))
+        for col, (style, file_stem) in zip(cols, _VIDEO_STYLE_FILES.items()):
+            with col:
+                st.download_button(
+                    f"💾 {_VIDEO_STYLE_LABELS[style]}",
+                    prompt_set[style],
+                    file_name=f"{file_stem}_{set_idx+1}.txt",
+                    mime="text/plain",
+                    key=f"download_{style}_{set_idx}",
+                    use_container_width=True
+                )
+    
+    st.divider()
+
+@st.fragment
+def render_video_tab():
+    """영상 프롬프트 탭 (버튼 조작 시 이 탭만 다시 실행)"""
     st.markdown("### 4️⃣ 영상 프롬프트 생성 (10초 3종 스타일)")
     
     if st.session_state.current_analysis and "content_briefs" in st.session_state.current_analysis:
@@ -1775,106 +2164,37 @@ with tab4:
                 with st.spinner("3가지 스타일의 영상 프롬프트 생성 중..."):
                     prompts_3styles = generate_video_prompts_3styles(video_brief)
                     
-                    if "video_prompts_3styles" not in st.session_state:
-                        st.session_state.video_prompts_3styles = []
-                    
-                    st.session_state.video_prompts_3styles.append(prompts_3styles)
-                    st.success("✅ 10초 영상 3종 프롬프트가 생성되었습니다!")
-                    st.balloons()
+                    # 같은 브리프면 결과도 같으므로 중복 세트는 추가하지 않음
+                    if prompts_3styles in st.session_state.video_prompts_3styles:
+                        st.info("이미 생성된 프롬프트 세트입니다. 아래에서 확인하세요.")
+                    else:
+                        st.session_state.video_prompts_3styles.append(prompts_3styles)
+                        st.success("✅ 10초 영상 3종 프롬프트가 생성되었습니다!")
+                        st.balloons()
             
             st.divider()
             
             # 3종 스타일 프롬프트 표시
-            if "video_prompts_3styles" in st.session_state and st.session_state.video_prompts_3styles:
+            if st.session_state.video_prompts_3styles:
                 st.markdown("### 📹 생성된 영상 프롬프트")
                 
+                st.download_button(
+                    "📦 모든 프롬프트 ZIP 다운로드",
+                    data=_zip_all_prompts(st.session_state.video_prompts_3styles),
+                    file_name=f"영상_프롬프트_{datetime.now().strftime('%Y%m%d')}.zip",
+                    mime="application/zip",
+                    key="download_all_video_prompts",
+                    use_container_width=True
+                )
+                
                 for set_idx, prompt_set in enumerate(st.session_state.video_prompts_3styles):
-                    st.markdown(f"#### 세트 {set_idx + 1}")
-                    
-                    # 스타일 1: 다큐멘터리
-                    with st.expander("🎥 스타일 1: 다큐멘터리 리얼리즘", expanded=True):
-                        st.text_area(
-                            "프롬프트 (다큐멘터리)",
-                            prompt_set["documentary"],
-                            height=400,
-                            key=f"video_doc_{set_idx}"
-                        )
-                        
-                        col1, col2, col3, col4 = st.columns(4)
-                        with col1:
-                            st.download_button(
-                                "💾 다운로드",
-                                prompt_set["documentary"],
-                                file_name=f"video_documentary_{set_idx+1}.txt",
-                                mime="text/plain",
-                                key=f"download_doc_{set_idx}",
-                                use_container_width=True
-                            )
-                        with col2:
-                            st.link_button("🎬 Sora", VIDEO_PLATFORMS["Sora"], use_container_width=True)
-                        with col3:
-                            st.link_button("🚀 Runway", VIDEO_PLATFORMS["Runway"], use_container_width=True)
-                        with col4:
-                            st.link_button("🎥 Pika", VIDEO_PLATFORMS["Pika"], use_container_width=True)
-                    
-                    # 스타일 2: 시네마틱
-                    with st.expander("🎬 스타일 2: 시네마틱 드라마", expanded=True):
-                        st.text_area(
-                            "프롬프트 (시네마틱)",
-                            prompt_set["cinematic"],
-                            height=400,
-                            key=f"video_cine_{set_idx}"
-                        )
-                        
-                        col1, col2, col3, col4 = st.columns(4)
-                        with col1:
-                            st.download_button(
-                                "💾 다운로드",
-                                prompt_set["cinematic"],
-                                file_name=f"video_cinematic_{set_idx+1}.txt",
-                                mime="text/plain",
-                                key=f"download_cine_{set_idx}",
-                                use_container_width=True
-                            )
-                        with col2:
-                            st.link_button("🎬 Sora", VIDEO_PLATFORMS["Sora"], use_container_width=True)
-                        with col3:
-                            st.link_button("🚀 Runway", VIDEO_PLATFORMS["Runway"], use_container_width=True)
-                        with col4:
-                            st.link_button("🎥 Pika", VIDEO_PLATFORMS["Pika"], use_container_width=True)
-                    
-                    # 스타일 3: 모던 다이내믹
-                    with st.expander("⚡ 스타일 3: 모던 다이내믹", expanded=True):
-                        st.text_area(
-                            "프롬프트 (모던)",
-                            prompt_set["modern_dynamic"],
-                            height=400,
-                            key=f"video_modern_{set_idx}"
-                        )
-                        
-                        col1, col2, col3, col4 = st.columns(4)
-                        with col1:
-                            st.download_button(
-                                "💾 다운로드",
-                                prompt_set["modern_dynamic"],
-                                file_name=f"video_modern_{set_idx+1}.txt",
-                                mime="text/plain",
-                                key=f"download_modern_{set_idx}",
-                                use_container_width=True
-                            )
-                        with col2:
-                            st.link_button("🎬 Sora", VIDEO_PLATFORMS["Sora"], use_container_width=True)
-                        with col3:
-                            st.link_button("🚀 Runway", VIDEO_PLATFORMS["Runway"], use_container_width=True)
-                        with col4:
-                            st.link_button("🎥 Pika", VIDEO_PLATFORMS["Pika"], use_container_width=True)
-                    
-                    st.divider()
+                    render_video_prompt_set(set_idx, prompt_set)
             else:
                 st.info("위의 '10초 영상 3종 프롬프트 생성' 버튼을 클릭하세요")
             
             st.divider()
             
+            # 플랫폼 링크는 스타일별로 반복하지 않고 여기서 한 번만 표시
             st.markdown("### 🎥 영상 제작 플랫폼")
             st.caption("생성된 프롬프트를 아래 플랫폼에서 사용하세요")
             cols = st.columns(len(VIDEO_PLATFORMS))
@@ -1888,6 +2208,67 @@ with tab4:
     else:
         st.info("먼저 AI 분석을 생성해주세요")
 
+with tab4:
+    render_video_tab()
+
+@st.fragment
+def render_export_downloads(policy: Dict[str, Any]):
+    """PDF/ZIP 다운로드 영역 (버튼 조작 시 이 영역만 다시 실행)"""
+    st.markdown("#### 📥 다운로드")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        if st.button("📄 PDF 보고서", use_container_width=True):
+            with st.spinner("PDF를 생성하고 있습니다..."):
+                # 이미지 바이트 수집
+                image_bytes = [img['bytes'] for img in st.session_state.generated_images]
+                
+                # 영상 프롬프트 텍스트 수집
+                video_texts = build_video_texts(st.session_state.video_prompts_3styles)
+                
+                analysis = st.session_state.current_analysis
+                pdf_bytes = _cached_pdf_report(
+                    _export_cache_key(policy, analysis, image_bytes, video_texts),
+                    policy,
+                    analysis,
+                    image_bytes,
+                    video_texts
+                )
+                st.download_button(
+                    "💾 PDF 다운로드",
+                    pdf_bytes,
+                    file_name=f"policy_report_{policy['id']}.pdf",
+                    mime="application/pdf",
+                    use_container_width=True
+                )
+    
+    with col2:
+        if st.button("📦 전체 ZIP", use_container_width=True):
+            with st.spinner("ZIP 파일을 생성하고 있습니다..."):
+                image_bytes = [img['bytes'] for img in st.session_state.generated_images]
+                
+                # 영상 프롬프트 3종 모두 텍스트로 변환
+                video_texts = build_video_texts(st.session_state.video_prompts_3styles)
+                
+                # ZIP 생성 (PDF 포함, 내용이 같으면 캐시 재사용)
+                analysis = st.session_state.current_analysis
+                zip_bytes = _cached_zip_export(
+                    _export_cache_key(policy, analysis, image_bytes, video_texts),
+                    policy,
+                    analysis,
+                    image_bytes,
+                    video_texts
+                )
+                
+                st.download_button(
+                    "💾 ZIP 다운로드",
+                    zip_bytes,
+                    file_name=f"policy_package_{policy['id']}.zip",
+                    mime="application/zip",
+                    use_container_width=True
+                )
+
 with tab5:
     st.markdown("### 5️⃣ 결과 및 내보내기")
     
@@ -1922,73 +2303,7 @@ with tab5:
         
         st.divider()
         
-        st.markdown("#### 📥 다운로드")
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            if st.button("📄 PDF 보고서", use_container_width=True):
-                with st.spinner("PDF를 생성하고 있습니다..."):
-                    # 이미지 바이트 수집
-                    image_bytes = [img['bytes'] for img in st.session_state.generated_images]
-                    
-                    # 영상 프롬프트 텍스트 수집
-                    video_texts = []
-                    for idx, prompt_set in enumerate(st.session_state.video_prompts_3styles, 1):
-                        video_texts.append(f"[세트 {idx} - 다큐멘터리]\n{prompt_set.get('documentary', '')}")
-                        video_texts.append(f"[세트 {idx} - 시네마틱]\n{prompt_set.get('cinematic', '')}")
-                        video_texts.append(f"[세트 {idx} - 모던 다이내믹]\n{prompt_set.get('modern_dynamic', '')}")
-                    
-                    pdf_bytes = create_pdf_report(
-                        policy, 
-                        st.session_state.current_analysis,
-                        images=image_bytes if image_bytes else None,
-                        video_prompts=video_texts if video_texts else None
-                    )
-                    st.download_button(
-                        "💾 PDF 다운로드",
-                        pdf_bytes,
-                        file_name=f"policy_report_{policy['id']}.pdf",
-                        mime="application/pdf",
-                        use_container_width=True
-                    )
-        
-        with col2:
-            if st.button("📦 전체 ZIP", use_container_width=True):
-                with st.spinner("ZIP 파일을 생성하고 있습니다..."):
-                    image_bytes = [img['bytes'] for img in st.session_state.generated_images]
-                    
-                    # 영상 프롬프트 3종 모두 텍스트로 변환
-                    video_texts = []
-                    for idx, prompt_set in enumerate(st.session_state.video_prompts_3styles, 1):
-                        video_texts.append(f"[세트 {idx} - 다큐멘터리]\n{prompt_set.get('documentary', '')}")
-                        video_texts.append(f"[세트 {idx} - 시네마틱]\n{prompt_set.get('cinematic', '')}")
-                        video_texts.append(f"[세트 {idx} - 모던 다이내믹]\n{prompt_set.get('modern_dynamic', '')}")
-                    
-                    # PDF 먼저 생성
-                    pdf_bytes = create_pdf_report(
-                        policy, 
-                        st.session_state.current_analysis,
-                        images=image_bytes if image_bytes else None,
-                        video_prompts=video_texts if video_texts else None
-                    )
-                    
-                    # ZIP 생성 (PDF 포함)
-                    zip_bytes = create_zip_export(
-                        policy,
-                        st.session_state.current_analysis,
-                        images=image_bytes,
-                        video_prompts=video_texts if video_texts else None,
-                        pdf_bytes=pdf_bytes
-                    )
-                    
-                    st.download_button(
-                        "💾 ZIP 다운로드",
-                        zip_bytes,
-                        file_name=f"policy_package_{policy['id']}.zip",
-                        mime="application/zip",
-                        use_container_width=True
-                    )
+        render_export_downloads(policy)
     
     else:
         st.info("정책을 생성하고 AI 분석을 완료해주세요")